@@ -365,14 +365,18 @@ def main():
         excerpt = scene_text[:300] + "..." if len(scene_text) > 300 else scene_text
         console.print(Panel(excerpt, title=f"Scene Excerpt", style="dim"))
         
-        # Update memory with scene content
-        enhanced_memory.add_scene_to_memory(
-            scene_id=scene_id,
-            act_number=scene_info['act'],
-            scene_number=scene_info['scene'],
-            content=scene_text,
-            characters=scene_info['characters']
-        )
+        # Update memory with scene content; cached scenes are unchanged, so
+        # only refresh the scene/act index for them
+        if result.get("cache_hit") and enhanced_memory.has_scene(scene_id):
+            enhanced_memory.index_scene(scene_id, scene_info['act'])
+        else:
+            enhanced_memory.add_scene_to_memory(
+                scene_id=scene_id,
+                act_number=scene_info['act'],
+                scene_number=scene_info['scene'],
+                content=scene_text,
+                characters=scene_info['characters']
+            )
         
         console.print()
     
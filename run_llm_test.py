@@ -3,12 +3,13 @@ Run the LLM integration test.
 """
 
 import os
-from dotenv import load_dotenv
-from tests.test_llm_integration import test_llm_integration
 
 
 def main():
     """Run the LLM integration test."""
+    from dotenv import load_dotenv
+    from tests.test_llm_integration import test_llm_integration
+
     # Load environment variables
     load_dotenv()
 
@@ -3,11 +3,12 @@ Runner script for enhanced playwright collaboration test.
 """
 
 import os
-from dotenv import load_dotenv
-from tests.unit.test_playwrights import test_enhanced_playwright_collaboration
 
 
 def main():
+    from dotenv import load_dotenv
+    from tests.unit.test_playwrights import test_enhanced_playwright_collaboration
+
     # Load environment variables
     load_dotenv()
 
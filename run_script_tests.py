@@ -0,0 +1,39 @@
+"""
+Run the standalone script tests concurrently under a single event loop.
+"""
+
+import asyncio
+import functools
+
+
+async def _run_test(fn, *args):
+    """Run a blocking test function in a worker thread."""
+    return await asyncio.get_running_loop().run_in_executor(None, functools.partial(fn, *args))
+
+
+async def run_all():
+    """Run the script tests concurrently, sharing one LLMManager."""
+    from thespian.llm import get_llm_manager
+    from test_single_scene import test_single_scene_generation
+    from test_simple_uniqueness import test_uniqueness_validation
+    from test_consolidated import main as main_consolidated
+
+    llm_manager = get_llm_manager()
+    return await asyncio.gather(
+        _run_test(test_single_scene_generation),
+        _run_test(test_uniqueness_validation),
+        _run_test(main_consolidated, llm_manager),
+        return_exceptions=True
+    )
+
+
+def main():
+    """Run the script tests and report each outcome."""
+    names = ["single scene generation", "uniqueness validation", "consolidated playwright"]
+    for name, outcome in zip(names, asyncio.run(run_all())):
+        status = "FAILED" if isinstance(outcome, Exception) or outcome is False else "OK"
+        print(f"{name}: {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,12 @@ Simple demonstration of the consolidated playwright module.
 """
 
 import sys
+import io
+import asyncio
 from pathlib import Path
-import os
-import json
-from datetime import datetime
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-import uuid
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Dict, get_args, get_origin
 
 # Add the project root to path
 project_root = Path(__file__).resolve().parent
@@ -27,52 +25,27 @@ from thespian.llm.consolidated_playwright import (
     CheckpointData
 )
 
-# Create a mock scene to demonstrate functionality
-MOCK_SCENE = """ACT 1, SCENE 1: THE LABORATORY
-
-[The scene opens in a high-tech laboratory with glowing holographic displays and softly humming equipment. DR. SARAH CHEN works intently at a terminal while DR. JAMES TANAKA reviews data on a floating screen. The AI ASSISTANT's voice comes from speakers throughout the room.]
-
-DR. SARAH CHEN: (focused, typing rapidly) The quantum signature is unlike anything we've ever seen before. The entanglement patterns suggest a temporal component.
-
-DR. JAMES TANAKA: (skeptical, adjusting glasses) That's theoretically impossible, Sarah. Quantum entanglement across time violates causality principles.
-
-AI ASSISTANT: (neutral, analytical) Analysis complete, Doctor Chen. The data shows a 99.7% probability of temporal quantum correlation. This matches your hypothesis.
-
-DR. SARAH CHEN: (excitedly) You see, James? The AI confirms it! We're looking at particles that appear to be entangled not just across space but across time itself.
-
-DR. JAMES TANAKA: (moving to another display, concerned) If this gets into corporate hands before we understand the implications... there are serious ethical considerations.
-
-[The lights briefly flicker. A low rumble is heard.]
-
-AI ASSISTANT: (alert) Warning. Unexpected power fluctuation detected in the quantum containment field.
-
-DR. SARAH CHEN: (alarmed) That shouldn't be possible with our safeguards! AI, run diagnostics immediately.
-
-DR. JAMES TANAKA: (moving quickly to a control panel) I'm stabilizing the field. But look at these readings—the temporal signature is amplifying itself.
-
-[The holographic displays flash with complex data patterns. The rumbling increases.]
-
-DR. SARAH CHEN: (realizing) My god, James. It's not just that the particles are entangled across time. I think they're actually creating a feedback loop with their future states.
-
-DR. JAMES TANAKA: (with dawning understanding) A temporal recursive entanglement? That would mean...
-
-AI ASSISTANT: (urgent) Critical anomaly detected. Recommend immediate containment protocols.
-
-[A bright flash of blue light erupts from the main quantum chamber, briefly engulfing the room, then subsiding.]
-
-DR. SARAH CHEN: (shaken, looking at new data streaming in) The data... it's changing. I think we just witnessed the first documented case of quantum-temporal interaction.
-
-DR. JAMES TANAKA: (solemn) We need to secure this lab immediately. And carefully consider what we do with this discovery.
-
-AI ASSISTANT: (thoughtful) I am detecting patterns in the quantum flux that suggest deliberate organization. This may not be merely a natural phenomenon.
-
-[The scientists exchange worried glances as the lights continue to flicker slightly.]
-
-DR. SARAH CHEN: (quietly) What have we discovered?
+def _field_formatter(annotation) -> Callable[[Any], str]:
+    """Return a stringifier specialized for a SceneRequirements field type."""
+    if get_origin(annotation) is list:
+        return ", ".join
+    if type(None) in get_args(annotation):
+        return lambda value: str(value) if value is not None else "None"
+    return str
+
+# Table cell formatters, resolved once from the requirements schema
+_FIELD_FORMATTERS: Dict[str, Callable[[Any], str]] = {
+    name: _field_formatter(field.annotation)
+    for name, field in SceneRequirements.model_fields.items()
+}
 
-[Blackout]
+# Mock scene text, read from disk on first use
+MOCK_SCENE_PATH = project_root / "_mock_scene.txt"
 
-END OF SCENE"""
+@lru_cache(maxsize=1)
+def get_mock_scene() -> str:
+    """Load the mock scene used to demonstrate functionality."""
+    return MOCK_SCENE_PATH.read_text(encoding="utf-8")
 
 # Mock evaluation data
 MOCK_EVALUATION = {
@@ -98,6 +71,8 @@ class MockPlaywright(Playwright):
 
     def generate_scene(self, requirements, **kwargs):
         """Mock implementation that returns the hard-coded scene."""
+        import uuid
+        
         # Simulate progress callback if provided
         progress_callback = kwargs.get("progress_callback")
         if progress_callback:
@@ -107,7 +82,7 @@ class MockPlaywright(Playwright):
         
         # Return a mock result
         return {
-            "scene": MOCK_SCENE,
+            "scene": get_mock_scene(),
             "evaluation": MOCK_EVALUATION,
             "timing_metrics": {
                 "initial_generation": 1.2,
@@ -125,6 +100,10 @@ class MockPlaywright(Playwright):
 
 def main():
     """Run simple demonstration."""
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+    
     console = Console()
     
     console.print(Panel.fit(
@@ -157,14 +136,8 @@ def main():
     requirements_table.add_column("Parameter", style="cyan")
     requirements_table.add_column("Value", style="green")
     
-    # Use model_dump instead of dict for compatibility with Pydantic v2
-    req_data = requirements.model_dump() if hasattr(requirements, "model_dump") else requirements.dict()
-    for field, value in req_data.items():
-        if isinstance(value, list):
-            value_str = ", ".join(value)
-        else:
-            value_str = str(value) if value is not None else "None"
-        requirements_table.add_row(field, value_str)
+    for field, fmt in _FIELD_FORMATTERS.items():
+        requirements_table.add_row(field, fmt(getattr(requirements, field)))
     
     console.print(requirements_table)
     
@@ -190,25 +163,22 @@ def main():
     for capability in playwright.enabled_capabilities:
         console.print(f"- {capability}")
     
-    # Generate scene with progress tracking
+    # Generate scene, printing progress events as they stream in
     console.print("\n[bold]Simulating scene generation...[/bold]")
-    progress_steps = []
     
-    def progress_callback(data):
-        progress_steps.append(data)
-        console.print(f"  - {data.get('message', 'Progress update')}")
+    async def stream_scene():
+        async for event in playwright.astream_scene_generation(requirements):
+            if event["phase"] == "complete":
+                return event["result"]
+            console.print(f"  - {event.get('message', 'Progress update')}")
     
-    # Generate scene
-    result = playwright.generate_scene(
-        requirements=requirements,
-        progress_callback=progress_callback
-    )
+    result = asyncio.run(stream_scene())
     
     # Display generated scene
     console.print("\n[bold]Generated Scene (sample):[/bold]")
     # Just show first few lines to avoid cluttering the console
-    scene_lines = result["scene"].split("\n")
-    sample_scene = "\n".join(scene_lines[:10] + ["...", "(scene truncated for display)"])
+    scene_lines = [line.rstrip("\n") for line in islice(io.StringIO(result["scene"]), 10)]
+    sample_scene = "\n".join(scene_lines + ["...", "(scene truncated for display)"])
     console.print(Panel(sample_scene, title="Scene Sample"))
     
     # Display evaluation
@@ -244,8 +214,7 @@ def main():
     
     # Save the full scene to a file
     output_file = Path("demo_scene.txt")
-    with open(output_file, "w") as f:
-        f.write(result["scene"])
+    output_file.write_bytes(result["scene"].encode("utf-8"))
     
     console.print(f"\nFull scene saved to: [bold]{output_file}[/bold]")
     console.print("\n[bold green]Demo completed successfully![/bold green]")
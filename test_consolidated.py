@@ -4,26 +4,18 @@
 Simple test script to verify that the consolidated playwright module works correctly.
 """
 
-import sys
-from pathlib import Path
-
-# Add the project root to sys.path
-project_root = Path(__file__).resolve().parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
-from thespian.llm import LLMManager
+from thespian.llm import LLMManager, get_llm_manager
 from thespian.llm.consolidated_playwright import Playwright, SceneRequirements, PlaywrightCapability, create_playwright
 from thespian.llm.theatrical_memory import TheatricalMemory
 from thespian.llm.theatrical_advisors import AdvisorManager
 from thespian.llm.quality_control import TheatricalQualityControl
 
-def main():
+def main(llm_manager: LLMManager = None):
     """Test that we can create a playwright instance."""
     print("Testing consolidated playwright module...")
     
     # Initialize components
-    llm_manager = LLMManager()
+    llm_manager = llm_manager or get_llm_manager()
     memory = TheatricalMemory()
     advisor_manager = AdvisorManager(llm_manager, memory)
     quality_control = TheatricalQualityControl()
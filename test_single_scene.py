@@ -4,13 +4,8 @@ Test script to generate a single scene and validate the fixes.
 """
 
 import os
-import sys
-from pathlib import Path
 import logging
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -6,10 +6,6 @@ Test script to validate the scene uniqueness fixes.
 import os
 import sys
 import uuid
-from pathlib import Path
-
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
 
 from thespian.llm.consolidated_playwright import (
     ConsolidatedPlaywright, 
@@ -13,13 +13,17 @@ class TestApp(App[None]):
     """Test application for widget testing."""
 
     def compose(self) -> None:
-        """Compose the test application."""
+        """Compose the test application, keeping references to each widget."""
+        self.scene_library = SceneLibrary(id="scene_library")
+        self.workspace = SceneWorkspace(id="scene_workspace", classes="test-workspace")
+        self.advisor_panel = AdvisorPanel(id="advisor_panel")
+        self.status_bar = StatusBar(id="status_bar")
         with Vertical():
             with Horizontal():
-                yield SceneLibrary(id="scene_library")
-                yield SceneWorkspace(id="scene_workspace", classes="test-workspace")
-            yield AdvisorPanel(id="advisor_panel")
-            yield StatusBar(id="status_bar")
+                yield self.scene_library
+                yield self.workspace
+            yield self.advisor_panel
+            yield self.status_bar
 
 # Ensure the SceneWorkspace is always tall enough in tests
 TestApp.CSS_PATH: CSSPathType = None  # Disable default CSS
@@ -108,7 +112,7 @@ async def test_scene_library(app: TestApp, sample_scene: Scene) -> None:
     """Test SceneLibrary widget functionality."""
     async with app.run_test(size=(120, 40)) as pilot:
         # Get the SceneLibrary widget
-        scene_library = app.query_one(SceneLibrary)
+        scene_library = app.scene_library
         
         # Test loading scenes
         scenes_data = {sample_scene.id: sample_scene}
@@ -127,7 +131,7 @@ async def test_scene_workspace(app: TestApp, sample_scene: Scene) -> None:
     """Test SceneWorkspace widget functionality."""
     async with app.run_test(size=(120, 40)) as pilot:
         # Get the SceneWorkspace widget
-        workspace = app.query_one(SceneWorkspace)
+        workspace = app.workspace
         
         # Test updating workspace with a scene
         workspace.update_workspace(sample_scene)
@@ -154,7 +158,7 @@ async def test_advisor_panel(app: TestApp, sample_feedback: Dict[str, Any]) -> N
     """Test AdvisorPanel widget functionality."""
     async with app.run_test(size=(120, 40)) as pilot:
         # Get the AdvisorPanel widget
-        advisor_panel = app.query_one(AdvisorPanel)
+        advisor_panel = app.advisor_panel
         
         # Test updating feedback
         advisor_panel.update_feedback(sample_feedback)
@@ -171,7 +175,7 @@ async def test_status_bar(app: TestApp) -> None:
     """Test StatusBar widget functionality."""
     async with app.run_test(size=(120, 40)) as pilot:
         # Get the StatusBar widget
-        status_bar = app.query_one(StatusBar)
+        status_bar = app.status_bar
         
         # Test direct message update
         status_bar.update_message("Test message")
@@ -194,10 +198,10 @@ async def test_widget_interactions(app: TestApp, sample_scene: Scene) -> None:
     """Test interactions between widgets."""
     async with app.run_test(size=(120, 40)) as pilot:
         # Get all widgets
-        scene_library = app.query_one(SceneLibrary)
-        workspace = app.query_one(SceneWorkspace)
-        advisor_panel = app.query_one(AdvisorPanel)
-        status_bar = app.query_one(StatusBar)
+        scene_library = app.scene_library
+        workspace = app.workspace
+        advisor_panel = app.advisor_panel
+        status_bar = app.status_bar
         
         # Load a scene
         scenes_data = {sample_scene.id: sample_scene}
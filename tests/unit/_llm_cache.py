@@ -0,0 +1,44 @@
+"""
+On-disk cache of LLM responses for integration tests.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict
+
+CACHE_PATH = Path(__file__).resolve().parent.parent / ".llm_cache" / "responses.json"
+
+_cache_lock = threading.Lock()
+
+
+def cached_generate(llm_manager, prompt: str, agent_id: str, path: Path = CACHE_PATH) -> Dict[str, Any]:
+    """Return llm_manager.generate_response(prompt, agent_id), reusing responses cached on disk.
+
+    Responses are keyed by a SHA-256 of the prompt and agent ID. A miss calls the
+    live backend and rewrites the cache file atomically; safe to call from threads.
+    """
+    key = hashlib.sha256(f"{prompt}|{agent_id}".encode("utf-8")).hexdigest()
+    with _cache_lock:
+        cache = _load(path)
+        if key in cache:
+            return cache[key]
+
+    # Call the backend outside the lock so concurrent misses overlap
+    result = llm_manager.generate_response(prompt, agent_id)
+
+    with _cache_lock:
+        cache = _load(path)
+        cache[key] = result
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, path)
+    return result
+
+
+def _load(path: Path) -> Dict[str, Any]:
+    """Read the cache file, or an empty cache if it does not exist yet."""
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
@@ -40,4 +40,22 @@ def test_checkpoint_manager_cleanup_old():
         manager.cleanup_old_checkpoints()
         assert not os.path.exists(checkpoint_path)
     finally:
-        shutil.rmtree(temp_dir) 
\ No newline at end of file
+        shutil.rmtree(temp_dir) 
+
+def test_save_checkpoints_batch_and_cleanup_keeps_newest():
+    temp_dir = tempfile.mkdtemp()
+    try:
+        manager = CheckpointManager(checkpoint_dir=temp_dir)
+        paths = manager.save_checkpoints_batch([(f"scene_{i}", f"Scene {i}", {"i": i}) for i in range(4)])
+        assert paths == [os.path.join(temp_dir, f"scene_{i}.json") for i in range(4)]
+        assert manager.load_checkpoint("scene_2").data == {"i": 2}
+        assert not [name for name in os.listdir(temp_dir) if name.endswith(".tmp")]
+        # Cleanup orders by the stored timestamp, not file mtime, and skips non-checkpoint files
+        for i, path in enumerate(paths):
+            os.utime(path, (2000 - i, 2000 - i))
+        with open(os.path.join(temp_dir, "notes.json"), "w") as f:
+            f.write('{"unrelated": true}')
+        assert manager.cleanup_old_checkpoints(max_checkpoints=2) == 2
+        assert sorted(os.listdir(temp_dir)) == ["notes.json", "scene_2.json", "scene_3.json"]
+    finally:
+        shutil.rmtree(temp_dir)
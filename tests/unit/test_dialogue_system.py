@@ -3,6 +3,7 @@ Test script for the dialogue system.
 """
 
 import os
+import pytest
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress
@@ -15,7 +16,9 @@ from thespian.llm.consolidated_playwright import Playwright, SceneRequirements,
 from thespian.llm.dialogue_system import DialogueSystem
 
 
-def main():
+@pytest.mark.slow()
+def test_dialogue_system():
+    """Generate a scene and render its evaluation and advisor dialogue history."""
     console = Console()
 
     # Initialize components
@@ -93,14 +96,14 @@ def main():
         if history:
             console.print(f"\n[bold]{advisor_type.title()} Advisor:[/bold]")
             for entry in history:
+                parts = [
+                    f"[bold]Question:[/bold] {entry['question']}",
+                    f"[bold]Feedback:[/bold] {entry['feedback']['feedback']}",
+                    "[bold]Suggestions:[/bold]",
+                ]
+                parts.extend(f"- {s}" for s in entry["feedback"]["suggestions"])
                 console.print(
-                    Panel(
-                        f"[bold]Question:[/bold] {entry['question']}\n"
-                        f"[bold]Feedback:[/bold] {entry['feedback']['feedback']}\n"
-                        f"[bold]Suggestions:[/bold]\n"
-                        + "\n".join(f"- {s}" for s in entry["feedback"]["suggestions"]),
-                        title=f"Dialogue Entry ({entry['timestamp']})",
-                    )
+                    Panel("\n".join(parts), title=f"Dialogue Entry ({entry['timestamp']})")
                 )
 
     # Display timing metrics
@@ -116,4 +119,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    test_dialogue_system()
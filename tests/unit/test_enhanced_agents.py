@@ -3,7 +3,8 @@ Unit tests for enhanced agent methods.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from pathlib import Path
+from unittest.mock import Mock, patch
 from thespian.agents_enhanced import (
     EnhancedDirectorAgent,
     EnhancedCharacterActorAgent,
@@ -12,37 +13,33 @@ from thespian.agents_enhanced import (
 )
 
 
+@pytest.fixture(scope="session")
+def llm_fixtures():
+    """Canned LLM responses for the enhanced agent tests, keyed by file stem."""
+    base = Path(__file__).resolve().parent.parent / "fixtures" / "enhanced_agents"
+    return {path.stem: path.read_text(encoding="utf-8") for path in base.glob("*.json")}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_llm_manager():
+    """Patch LLMManager once for every agent constructed in this module."""
+    with patch('thespian.llm.manager.LLMManager') as mock_manager:
+        yield mock_manager
+
+
 class TestEnhancedDirectorAgent:
     """Test enhanced director agent methods."""
     
     @pytest.fixture
     def director(self):
         """Create a director agent with mocked LLM."""
-        with patch('thespian.llm.manager.LLMManager') as mock_llm_manager:
-            mock_llm = Mock()
-            mock_llm_manager.return_value.llm = mock_llm
-            agent = EnhancedDirectorAgent()
-            agent.llm = mock_llm
-            return agent
+        agent = EnhancedDirectorAgent()
+        agent.llm = Mock()
+        return agent
     
-    def test_provide_scene_notes(self, director):
+    def test_provide_scene_notes(self, director, llm_fixtures):
         """Test director provides comprehensive scene notes."""
-        director.llm.generate.return_value = """
-        {
-            "pacing": "Build tension slowly through the first half, then accelerate",
-            "tone": "Dark comedy with undertones of existential dread",
-            "blocking_suggestions": [
-                "Characters should maintain physical distance initially",
-                "Gradual closing of space as conflict intensifies"
-            ],
-            "emotional_beats": [
-                {"line": 10, "emotion": "suppressed anger"},
-                {"line": 25, "emotion": "breaking point"},
-                {"line": 40, "emotion": "bitter resignation"}
-            ],
-            "technical_notes": "Use lighting to create shadows that grow longer as scene progresses"
-        }
-        """
+        director.llm.generate.return_value = llm_fixtures["provide_scene_notes"]
         
         scene = "A tense confrontation between two old friends"
         requirements = {"theme": "betrayal", "mood": "tense"}
@@ -56,23 +53,9 @@ class TestEnhancedDirectorAgent:
         assert isinstance(notes.get("blocking_suggestions"), list)
         assert len(notes.get("emotional_beats", [])) == 3
     
-    def test_workshop_scene(self, director):
+    def test_workshop_scene(self, director, llm_fixtures):
         """Test director workshops scene with actors."""
-        director.llm.generate.return_value = """
-        {
-            "workshop_notes": "The scene needs more subtext in the dialogue",
-            "character_dynamics": {
-                "tension_points": ["The unspoken history", "Power imbalance"],
-                "relationship_evolution": "From guarded politeness to open hostility"
-            },
-            "suggested_improvements": [
-                "Add more pauses for dramatic effect",
-                "Include physical business to show nervousness",
-                "Layer in contradictory body language"
-            ],
-            "actor_feedback_integration": "Incorporated actor suggestions for more naturalistic dialogue"
-        }
-        """
+        director.llm.generate.return_value = llm_fixtures["workshop_scene"]
         
         scene = "Two characters meeting after years apart"
         actors = [Mock(), Mock()]
@@ -91,32 +74,16 @@ class TestEnhancedCharacterActorAgent:
     @pytest.fixture
     def actor(self):
         """Create an actor agent with mocked LLM."""
-        with patch('thespian.llm.manager.LLMManager') as mock_llm_manager:
-            mock_llm = Mock()
-            mock_llm_manager.return_value.llm = mock_llm
-            agent = EnhancedCharacterActorAgent(
-                character_name="Hamlet",
-                character_data={"description": "The Prince of Denmark", "traits": ["melancholic", "intellectual"]}
-            )
-            agent.llm = mock_llm
-            return agent
-    
-    def test_suggest_dialogue_improvements(self, actor):
+        agent = EnhancedCharacterActorAgent(
+            character_name="Hamlet",
+            character_data={"description": "The Prince of Denmark", "traits": ["melancholic", "intellectual"]}
+        )
+        agent.llm = Mock()
+        return agent
+    
+    def test_suggest_dialogue_improvements(self, actor, llm_fixtures):
         """Test actor suggests dialogue improvements."""
-        actor.llm.generate.return_value = """
-        [
-            {
-                "original": "I am sad about this.",
-                "improved": "The weight of this sorrow threatens to unmake me.",
-                "reasoning": "More poetic and character-appropriate language"
-            },
-            {
-                "original": "Yes, I agree.",
-                "improved": "Indeed... though agreement tastes of ash in my mouth.",
-                "reasoning": "Adds complexity and internal conflict"
-            }
-        ]
-        """
+        actor.llm.generate.return_value = llm_fixtures["suggest_dialogue_improvements"]
         
         scene = "Hamlet contemplates his situation"
         character_profile = {"traits": ["melancholic", "intellectual"]}
@@ -127,23 +94,9 @@ class TestEnhancedCharacterActorAgent:
         assert "improved" in suggestions[0]
         assert "reasoning" in suggestions[0]
     
-    def test_validate_character_consistency(self, actor):
+    def test_validate_character_consistency(self, actor, llm_fixtures):
         """Test character consistency validation."""
-        actor.llm.generate.return_value = """
-        {
-            "is_consistent": true,
-            "consistency_score": 0.85,
-            "inconsistencies": [
-                {
-                    "line": "I shall act swiftly!",
-                    "issue": "Hamlet is typically indecisive",
-                    "severity": "minor"
-                }
-            ],
-            "character_growth": "Shows natural progression from paralysis to action",
-            "suggestions": ["Add more internal hesitation before decisive moments"]
-        }
-        """
+        actor.llm.generate.return_value = llm_fixtures["validate_character_consistency"]
         
         scene = "Hamlet makes a decision"
         previous_scenes = ["Scene 1", "Scene 2"]
@@ -154,17 +107,9 @@ class TestEnhancedCharacterActorAgent:
         assert validation["consistency_score"] == 0.85
         assert len(validation["inconsistencies"]) == 1
     
-    def test_develop_subtext(self, actor):
+    def test_develop_subtext(self, actor, llm_fixtures):
         """Test subtext development for dialogue."""
-        actor.llm.generate.return_value = """
-        {
-            "surface_meaning": "Greeting an old friend",
-            "subtext": "Testing whether they can still be trusted",
-            "delivery_notes": "Slight pause before 'friend', emphasis on 'long'",
-            "body_language": "Formal handshake instead of embrace, maintained eye contact",
-            "internal_monologue": "Can I trust you after what happened?"
-        }
-        """
+        actor.llm.generate.return_value = llm_fixtures["develop_subtext"]
         
         dialogue_line = "Hello, old friend. It's been a long time."
         context = {"relationship": "former allies", "scene": "reunion"}
@@ -182,40 +127,13 @@ class TestEnhancedSetCostumeDesignAgent:
     @pytest.fixture
     def designer(self):
         """Create a designer agent with mocked LLM."""
-        with patch('thespian.llm.manager.LLMManager') as mock_llm_manager:
-            mock_llm = Mock()
-            mock_llm_manager.return_value.llm = mock_llm
-            agent = EnhancedSetCostumeDesignAgent()
-            agent.llm = mock_llm
-            return agent
+        agent = EnhancedSetCostumeDesignAgent()
+        agent.llm = Mock()
+        return agent
     
-    def test_suggest_scene_elements(self, designer):
+    def test_suggest_scene_elements(self, designer, llm_fixtures):
         """Test designer suggests scene elements."""
-        designer.llm.generate.return_value = """
-        {
-            "set_pieces": [
-                {
-                    "item": "Weathered wooden desk",
-                    "placement": "Stage right",
-                    "significance": "Represents authority and age"
-                },
-                {
-                    "item": "Cracked mirror",
-                    "placement": "Upstage center",
-                    "significance": "Fractured self-perception"
-                }
-            ],
-            "costume_details": [
-                {
-                    "character": "Hamlet",
-                    "elements": ["Disheveled black doublet", "Untied cravat"],
-                    "symbolism": "Internal chaos manifested externally"
-                }
-            ],
-            "color_palette": ["Deep blacks", "Muted grays", "Single splash of crimson"],
-            "textures": ["Rough hewn wood", "Tarnished metal", "Heavy velvet"]
-        }
-        """
+        designer.llm.generate.return_value = llm_fixtures["suggest_scene_elements"]
         
         scene = "Hamlet's private chamber"
         mood = "introspective melancholy"
@@ -227,25 +145,9 @@ class TestEnhancedSetCostumeDesignAgent:
         assert len(elements.get("costume_details", [])) == 1
         assert "color_palette" in elements
     
-    def test_create_atmosphere_notes(self, designer):
+    def test_create_atmosphere_notes(self, designer, llm_fixtures):
         """Test atmosphere creation notes."""
-        designer.llm.generate.return_value = """
-        {
-            "lighting_design": {
-                "overall": "Chiaroscuro effect with deep shadows",
-                "key_moments": [
-                    {"cue": "Hamlet enters", "effect": "Single shaft of light from high window"},
-                    {"cue": "Revelation", "effect": "Lightning flash through window"}
-                ]
-            },
-            "sound_design": {
-                "ambient": "Distant thunder, old house creaking",
-                "effects": ["Clock chiming midnight", "Sudden silence before climax"]
-            },
-            "spatial_dynamics": "Vast empty space emphasizing isolation",
-            "sensory_details": "Smell of old books and dust, cold draft from unseen source"
-        }
-        """
+        designer.llm.generate.return_value = llm_fixtures["create_atmosphere_notes"]
         
         scene_context = {"location": "castle", "time": "midnight", "mood": "ominous"}
         
@@ -264,38 +166,13 @@ class TestEnhancedStageManagerAgent:
     @pytest.fixture
     def stage_manager(self):
         """Create a stage manager agent with mocked LLM."""
-        with patch('thespian.llm.manager.LLMManager') as mock_llm_manager:
-            mock_llm = Mock()
-            mock_llm_manager.return_value.llm = mock_llm
-            agent = EnhancedStageManagerAgent()
-            agent.llm = mock_llm
-            return agent
+        agent = EnhancedStageManagerAgent()
+        agent.llm = Mock()
+        return agent
     
-    def test_check_continuity(self, stage_manager):
+    def test_check_continuity(self, stage_manager, llm_fixtures):
         """Test continuity checking."""
-        stage_manager.llm.generate.return_value = """
-        {
-            "continuity_issues": [
-                {
-                    "type": "prop",
-                    "issue": "Dagger appears in scene 3 but not established earlier",
-                    "severity": "major",
-                    "solution": "Add dagger to Hamlet's belt in scene 1"
-                },
-                {
-                    "type": "costume",
-                    "issue": "Ophelia's dress changes color between scenes",
-                    "severity": "minor",
-                    "solution": "Keep consistent white dress throughout act"
-                }
-            ],
-            "timeline_consistency": true,
-            "character_tracking": {
-                "all_characters_accounted": true,
-                "entrance_exit_issues": []
-            }
-        }
-        """
+        stage_manager.llm.generate.return_value = llm_fixtures["check_continuity"]
         
         scenes = ["Scene 1", "Scene 2", "Scene 3"]
         
@@ -308,28 +185,9 @@ class TestEnhancedStageManagerAgent:
         assert continuity["timeline_consistency"] is True
         assert continuity["character_tracking"]["all_characters_accounted"] is True
     
-    def test_track_technical_elements(self, stage_manager):
+    def test_track_technical_elements(self, stage_manager, llm_fixtures):
         """Test technical element tracking."""
-        stage_manager.llm.generate.return_value = """
-        {
-            "lighting_cues": [
-                {"cue_number": "LX1", "trigger": "Opening of scene", "effect": "Sunrise"},
-                {"cue_number": "LX2", "trigger": "Hamlet's entrance", "effect": "Spotlight DSC"}
-            ],
-            "sound_cues": [
-                {"cue_number": "SQ1", "trigger": "Pre-show", "effect": "Wind and rain"},
-                {"cue_number": "SQ2", "trigger": "Ghost appears", "effect": "Ethereal music"}
-            ],
-            "prop_list": [
-                {"item": "Letter", "scene": "2.1", "character": "Hamlet"},
-                {"item": "Skull", "scene": "5.1", "character": "Gravedigger"}
-            ],
-            "scene_changes": [
-                {"between": "1.1-1.2", "duration": "30 seconds", "elements": ["Remove throne", "Add garden bench"]}
-            ],
-            "technical_warnings": ["Fog machine needed for ghost scenes", "Quick change required for Polonius"]
-        }
-        """
+        stage_manager.llm.generate.return_value = llm_fixtures["track_technical_elements"]
         
         production_script = "Full Hamlet script"
         
@@ -342,21 +200,17 @@ class TestEnhancedStageManagerAgent:
         assert "technical_warnings" in technical
 
 
-def test_all_agents_have_enhanced_methods():
-    """Verify all enhanced agents have required methods."""
-    # Director
-    assert hasattr(EnhancedDirectorAgent, 'provide_scene_notes')
-    assert hasattr(EnhancedDirectorAgent, 'workshop_scene')
-    
-    # Actor
-    assert hasattr(EnhancedCharacterActorAgent, 'suggest_dialogue_improvements')
-    assert hasattr(EnhancedCharacterActorAgent, 'validate_character_consistency')
-    assert hasattr(EnhancedCharacterActorAgent, 'develop_subtext')
-    
-    # Designer
-    assert hasattr(EnhancedSetCostumeDesignAgent, 'suggest_scene_elements')
-    assert hasattr(EnhancedSetCostumeDesignAgent, 'create_atmosphere_notes')
-    
-    # Stage Manager
-    assert hasattr(EnhancedStageManagerAgent, 'check_continuity')
-    assert hasattr(EnhancedStageManagerAgent, 'track_technical_elements')
\ No newline at end of file
+@pytest.mark.parametrize(("agent_cls", "method"), [
+    (EnhancedDirectorAgent, 'provide_scene_notes'),
+    (EnhancedDirectorAgent, 'workshop_scene'),
+    (EnhancedCharacterActorAgent, 'suggest_dialogue_improvements'),
+    (EnhancedCharacterActorAgent, 'validate_character_consistency'),
+    (EnhancedCharacterActorAgent, 'develop_subtext'),
+    (EnhancedSetCostumeDesignAgent, 'suggest_scene_elements'),
+    (EnhancedSetCostumeDesignAgent, 'create_atmosphere_notes'),
+    (EnhancedStageManagerAgent, 'check_continuity'),
+    (EnhancedStageManagerAgent, 'track_technical_elements'),
+])
+def test_all_agents_have_enhanced_methods(agent_cls, method):
+    """Verify each enhanced agent has its required methods."""
+    assert hasattr(agent_cls, method)
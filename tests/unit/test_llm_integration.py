@@ -2,16 +2,20 @@
 Test script for LLM integration in Thespian framework.
 """
 
+import json
 import os
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
 from thespian.llm import LLMManager
-from rich.console import Console
-from rich.panel import Panel
-from rich.markdown import Markdown
-from rich.table import Table
+from thespian.llm.manager import LLMResponse
+from tests.unit._llm_cache import cached_generate
 
-console = Console()
+# Rich rendering is only for humans watching a live run
+VERBOSE = bool(os.environ.get("THESPIAN_TEST_VERBOSE"))
 
 
+@pytest.mark.slow()
 def test_llm_integration():
     """Test the LLM integration with both Ollama and Grok models."""
 
@@ -28,48 +32,87 @@ def test_llm_integration():
     # Test with different agent IDs to ensure distribution
     agent_ids = ["playwright_1", "director_1", "actor_1"]
 
-    console.print(
-        Panel.fit(
-            "[bold blue]Testing LLM Integration[/bold blue]\n\n"
-            "Using:\n"
-            f"- Ollama ({llm_manager.config.ollama_model})\n"
-            f"- Grok ({llm_manager.config.grok_model})",
-            title="Thespian LLM Test",
-            border_style="blue",
+    if VERBOSE:
+        from rich.console import Console
+        from rich.panel import Panel
+        from rich.table import Table
+
+        console = Console()
+        console.print(
+            Panel.fit(
+                "[bold blue]Testing LLM Integration[/bold blue]\n\n"
+                "Using:\n"
+                f"- Ollama ({llm_manager.config.ollama_model})\n"
+                f"- Grok ({llm_manager.config.grok_model})",
+                title="Thespian LLM Test",
+                border_style="blue",
+            )
         )
-    )
-
-    for prompt_idx, prompt in enumerate(test_prompts, 1):
-        console.print(f"\n[bold yellow]Test Prompt {prompt_idx}:[/bold yellow]")
-        console.print(Panel(prompt, style="yellow"))
-
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Agent")
-        table.add_column("Model")
-        table.add_column("Response")
-
-        for agent_id in agent_ids:
-            try:
-                # Get model info before generating response
-                model_info = llm_manager.get_model_info(agent_id)
-                model_type = model_info["type"].capitalize()
-
-                # Generate response
-                result = llm_manager.generate_response(prompt, agent_id)
-
-                # Add result to table
-                table.add_row(
-                    f"[cyan]{agent_id}[/cyan]", f"[green]{model_type}[/green]", result["response"]
-                )
-            except Exception as e:
-                table.add_row(
-                    f"[cyan]{agent_id}[/cyan]",
-                    f"[red]{model_type}[/red]",
-                    f"[red]Error: {str(e)}[/red]",
-                )
-
-        console.print(table)
-        console.print("\n" + "=" * 80)
+
+    def run_case(case):
+        prompt, agent_id = case
+        model_type = "Unknown"
+        try:
+            # Get model info before generating response
+            model_info = llm_manager.get_model_info(agent_id)
+            model_type = model_info["type"].capitalize()
+
+            # Generate response
+            result = cached_generate(llm_manager, prompt, agent_id)
+            return (f"[cyan]{agent_id}[/cyan]", f"[green]{model_type}[/green]", result["response"])
+        except Exception as e:
+            return (
+                f"[cyan]{agent_id}[/cyan]",
+                f"[red]{model_type}[/red]",
+                f"[red]Error: {str(e)}[/red]",
+            )
+
+    # Issue every prompt/agent call at once; they are I/O-bound round-trips
+    cases = [(prompt, agent_id) for prompt in test_prompts for agent_id in agent_ids]
+    with ThreadPoolExecutor(max_workers=len(cases)) as executor:
+        all_rows = list(executor.map(run_case, cases))
+
+    if VERBOSE:
+        for prompt_idx, prompt in enumerate(test_prompts, 1):
+            console.print(f"\n[bold yellow]Test Prompt {prompt_idx}:[/bold yellow]")
+            console.print(Panel(prompt, style="yellow"))
+
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("Agent")
+            table.add_column("Model")
+            table.add_column("Response")
+            for row in all_rows[(prompt_idx - 1) * len(agent_ids):prompt_idx * len(agent_ids)]:
+                table.add_row(*row)
+
+            console.print(table)
+            console.print("\n" + "=" * 80)
+
+
+def test_llm_integration_mocked():
+    """Test response generation and model routing without a live LLM backend."""
+    llm_manager = LLMManager()
+    llm_manager._ollama = MagicMock(spec=["invoke"])
+    llm_manager._ollama.invoke.return_value = LLMResponse("mock")
+
+    for agent_id in ["playwright_1", "director_1", "actor_1"]:
+        assert llm_manager.get_model_info(agent_id)["type"] in {"ollama", "grok"}
+        result = llm_manager.generate_response("Describe a dramatic scene.", agent_id)
+        assert result == {"response": "mock", "model": "ollama"}
+
+    assert llm_manager._ollama.invoke.call_count == 3
+
+
+def test_cached_generate_reuses_disk_responses(tmp_path):
+    """Test that cached responses are served from disk without calling the backend."""
+    llm_manager = MagicMock(spec=["generate_response"])
+    llm_manager.generate_response.return_value = {"response": "mock", "model": "ollama"}
+    path = tmp_path / "responses.json"
+
+    assert cached_generate(llm_manager, "prompt", "actor_1", path) == {"response": "mock", "model": "ollama"}
+    assert cached_generate(llm_manager, "prompt", "actor_1", path) == {"response": "mock", "model": "ollama"}
+    cached_generate(llm_manager, "prompt", "director_1", path)
+    assert llm_manager.generate_response.call_count == 2
+    assert len(json.loads(path.read_text())) == 2
 
 
 if __name__ == "__main__":
@@ -3,8 +3,23 @@ from thespian.llm.config import LLMConfig
 from thespian.llm.models import LLMManager
 
 
-def test_llmconfig_defaults():
-    config = LLMConfig()
+@pytest.fixture(autouse=True)
+def stub_ollama_response(monkeypatch):
+    """Keep every LLMManager in this module off the network."""
+    monkeypatch.setattr(
+        LLMManager,
+        "_generate_ollama_response",
+        lambda self, prompt, **kwargs: {"response": "test", "model": "long-gemma"},
+    )
+
+
+@pytest.fixture(scope="module")
+def config():
+    """Shared, read-only LLMConfig for the tests that do not modify it."""
+    return LLMConfig()
+
+
+def test_llmconfig_defaults(config):
     assert config.ollama_base_url == "http://localhost:11434"
     assert config.ollama_model == "long-gemma"
     assert config.grok_api_base == "https://api.x.ai/v1"
@@ -22,14 +37,20 @@ def test_llmconfig_should_use_ollama():
     assert isinstance(result, bool)
 
 
-def test_llmconfig_get_model_config():
-    config = LLMConfig()
-    ollama_conf = config.get_model_config("ollama")
-    assert ollama_conf["base_url"] == config.ollama_base_url
-    assert ollama_conf["model"] == config.ollama_model
-    grok_conf = config.get_model_config("grok")
-    assert grok_conf["api_base"] == config.grok_api_base
-    assert grok_conf["model"] == config.grok_model
+@pytest.mark.parametrize(
+    ("provider", "field", "attr"),
+    [
+        ("ollama", "base_url", "ollama_base_url"),
+        ("ollama", "model", "ollama_model"),
+        ("grok", "api_base", "grok_api_base"),
+        ("grok", "model", "grok_model"),
+    ],
+)
+def test_llmconfig_get_model_config(config, provider, field, attr):
+    assert config.get_model_config(provider)[field] == getattr(config, attr)
+
+
+def test_llmconfig_get_model_config_unknown(config):
     with pytest.raises(ValueError):
         config.get_model_config("unknown")
 
@@ -42,10 +63,8 @@ def test_llmmanager_init_and_model_info():
     assert info["type"] == "ollama"
 
 
-def test_llmmanager_generate_response(monkeypatch):
+def test_llmmanager_generate_response():
     manager = LLMManager()
-    # Patch _generate_ollama_response to avoid real HTTP call
-    manager._generate_ollama_response = lambda prompt, **kwargs: {"response": "test", "model": "long-gemma"}
     resp = manager.generate_response("hello", "agent1")
     assert resp["response"] == "test"
     assert resp["model"] == "long-gemma" 
\ No newline at end of file
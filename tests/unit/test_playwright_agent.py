@@ -44,7 +44,7 @@ def test_generate_scene_success(basic_playwright):
         act_number=1,
         scene_number=1
     )
-    with patch.object(EnhancedPlaywright, "get_llm") as mock_get_llm, \
+    with patch.object(Playwright, "get_llm") as mock_get_llm, \
          patch.object(TheatricalQualityControl, "evaluate_scene") as mock_evaluate_scene:
         mock_llm = MagicMock()
         mock_llm.invoke.return_value = MagicMock(content="FAKE SCENE CONTENT")
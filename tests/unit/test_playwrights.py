@@ -2,11 +2,14 @@
 Test script for enhanced playwright collaboration with advisor integration.
 """
 
+import asyncio
 import os
+import threading
+import pytest
 from thespian.llm import LLMManager
 from thespian.llm.consolidated_playwright import Playwright, SceneRequirements, PlaywrightCapability, create_playwright
 from thespian.llm.theatrical_memory import CharacterProfile, TheatricalMemory, StoryOutline
-from thespian.llm.theatrical_advisors import AdvisorManager
+from thespian.llm.theatrical_advisors import AdvisorFeedback, AdvisorManager
 from thespian.llm.quality_control import TheatricalQualityControl
 from thespian.llm.dialogue_system import DialogueSystem
 from rich.console import Console
@@ -16,11 +19,73 @@ from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from typing import Dict, Any, List
 import uuid
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 console = Console()
 
+# Keys every generation result and iteration record must carry
+_RESULT_KEYS = frozenset(
+    {"scene", "evaluation", "timing_metrics", "dialogue_history", "iteration_metrics"}
+)
+_ITERATION_METRIC_KEYS = frozenset(
+    {
+        "iteration_number",
+        "quality_scores",
+        "significant_changes",
+        "advisor_dialogues",
+        "enhancement_time",
+    }
+)
+
+# Act outline shared by the collaboration tests; key_events is a tuple so copies stay independent
+_WRITERS_JOURNEY_ACT = {
+    "act_number": 1,
+    "description": "The beginning of John's journey as a writer",
+    "key_events": (
+        "John meets Sarah at the coffee shop",
+        "They discuss his manuscript",
+        "Sarah offers to help edit",
+        "John struggles with self-doubt",
+        "They agree to work together",
+    ),
+    "status": "committed",
+    "act_id": str(uuid.uuid4()),
+    "version": "1.0",
+}
+
+
+def _render_playwright_result(name: str, result: Dict[str, Any], border_style: str) -> None:
+    """Print a playwright's scene, advisor feedback, iteration and timing metrics."""
+    console.print(f"\n[bold cyan]{name}'s Scene:[/bold cyan]")
+    console.print(Panel(result["scene"], border_style=border_style))
+    console.print("\n[bold cyan]Advisor Feedback:[/bold cyan]")
+    console.print(Markdown(str(result["evaluation"])))
+
+    console.print(f"\n[bold cyan]{name}'s Iteration Metrics:[/bold cyan]")
+    for metric in result["iteration_metrics"]:
+        console.print(
+            Panel(
+                f"Iteration {metric['iteration_number']}\n"
+                f"Quality Scores: {metric['quality_scores']}\n"
+                f"Significant Changes: {metric['significant_changes']}\n"
+                f"Advisor Dialogues: {metric['advisor_dialogues']}\n"
+                f"Enhancement Time: {metric['enhancement_time']:.2f}s",
+                title=f"Iteration {metric['iteration_number']}",
+                border_style="cyan",
+            )
+        )
+
+    timing_table = Table(title=f"{name} Scene Generation Timing")
+    timing_table.add_column("Stage", style="cyan")
+    timing_table.add_column("Time (s)", style="green")
+    for stage, time_taken in result["timing_metrics"].items():
+        timing_table.add_row(stage.replace("_", " ").title(), f"{time_taken:.2f}")
+    console.print(timing_table)
 
+
+@pytest.mark.slow()
 def test_enhanced_playwright_collaboration():
     """Test collaboration between enhanced playwrights with advisor integration."""
 
@@ -57,27 +122,8 @@ def test_enhanced_playwright_collaboration():
     )
 
     # Initialize story outline
-    story_outline = StoryOutline(
-        title="The Writer's Journey",
-        acts=[
-            {
-                "act_number": 1,
-                "description": "The beginning of John's journey as a writer",
-                "key_events": [
-                    "John meets Sarah at the coffee shop",
-                    "They discuss his manuscript",
-                    "Sarah offers to help edit",
-                    "John struggles with self-doubt",
-                    "They agree to work together"
-                ],
-                "status": "committed",
-                "act_id": str(uuid.uuid4()),
-                "version": "1.0"
-            }
-        ],
-        planning_status="committed",
-        version="1.0"
-    )
+    story_outline = StoryOutline(title="The Writer's Journey", acts=[dict(_WRITERS_JOURNEY_ACT)])
+    story_outline.planning_status = "committed"
 
     # Set story outline for both playwrights
     ollama_playwright.story_outline = story_outline
@@ -153,9 +199,7 @@ def test_enhanced_playwright_collaboration():
         scene_number=1
     )
 
-    # Test individual scene generation with advisor feedback
-    console.print("\n[bold yellow]Testing Individual Scene Generation with Advisors[/bold yellow]")
-
+    # Individual and collaborative generation share a single live progress display
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -163,8 +207,9 @@ def test_enhanced_playwright_collaboration():
         TimeElapsedColumn(),
         console=console,
     ) as progress:
-        # Ollama scene generation
         task1 = progress.add_task("[green]Generating Ollama scene...", total=100)
+        task2 = progress.add_task("[blue]Generating Grok scene...", total=100)
+        task3 = progress.add_task("[yellow]Generating collaborative scene...", total=100)
 
         def ollama_progress_callback(current: int, total: int):
             status = (
@@ -182,14 +227,6 @@ def test_enhanced_playwright_collaboration():
                 description=f"[green]Ollama: {status}",
             )
 
-        ollama_result = ollama_playwright.generate_scene(
-            scene_requirements, progress_callback=ollama_progress_callback
-        )
-        progress.update(task1, completed=100, description="[green]Ollama: Complete")
-
-        # Grok scene generation
-        task2 = progress.add_task("[blue]Generating Grok scene...", total=100)
-
         def grok_progress_callback(current: int, total: int):
             status = (
                 "Generating initial scene"
@@ -204,80 +241,6 @@ def test_enhanced_playwright_collaboration():
                 task2, completed=int((current / total) * 100), description=f"[blue]Grok: {status}"
             )
 
-        grok_result = grok_playwright.generate_scene(
-            scene_requirements, progress_callback=grok_progress_callback
-        )
-        progress.update(task2, completed=100, description="[blue]Grok: Complete")
-
-    # Display individual scenes with advisor feedback
-    console.print("\n[bold cyan]Ollama's Scene:[/bold cyan]")
-    console.print(Panel(ollama_result["scene"], border_style="green"))
-    console.print("\n[bold cyan]Advisor Feedback:[/bold cyan]")
-    console.print(Markdown(str(ollama_result["evaluation"])))
-
-    # Display iteration metrics
-    console.print("\n[bold cyan]Ollama's Iteration Metrics:[/bold cyan]")
-    for metric in ollama_result["iteration_metrics"]:
-        console.print(
-            Panel(
-                f"Iteration {metric['iteration_number']}\n"
-                f"Quality Scores: {metric['quality_scores']}\n"
-                f"Significant Changes: {metric['significant_changes']}\n"
-                f"Advisor Dialogues: {metric['advisor_dialogues']}\n"
-                f"Enhancement Time: {metric['enhancement_time']:.2f}s",
-                title=f"Iteration {metric['iteration_number']}",
-                border_style="cyan",
-            )
-        )
-
-    # Display timing metrics
-    timing_table = Table(title="Ollama Scene Generation Timing")
-    timing_table.add_column("Stage", style="cyan")
-    timing_table.add_column("Time (s)", style="green")
-    for stage, time_taken in ollama_result["timing_metrics"].items():
-        timing_table.add_row(stage.replace("_", " ").title(), f"{time_taken:.2f}")
-    console.print(timing_table)
-
-    console.print("\n[bold cyan]Grok's Scene:[/bold cyan]")
-    console.print(Panel(grok_result["scene"], border_style="blue"))
-    console.print("\n[bold cyan]Advisor Feedback:[/bold cyan]")
-    console.print(Markdown(str(grok_result["evaluation"])))
-
-    # Display iteration metrics
-    console.print("\n[bold cyan]Grok's Iteration Metrics:[/bold cyan]")
-    for metric in grok_result["iteration_metrics"]:
-        console.print(
-            Panel(
-                f"Iteration {metric['iteration_number']}\n"
-                f"Quality Scores: {metric['quality_scores']}\n"
-                f"Significant Changes: {metric['significant_changes']}\n"
-                f"Advisor Dialogues: {metric['advisor_dialogues']}\n"
-                f"Enhancement Time: {metric['enhancement_time']:.2f}s",
-                title=f"Iteration {metric['iteration_number']}",
-                border_style="cyan",
-            )
-        )
-
-    # Display timing metrics
-    timing_table = Table(title="Grok Scene Generation Timing")
-    timing_table.add_column("Stage", style="cyan")
-    timing_table.add_column("Time (s)", style="green")
-    for stage, time_taken in grok_result["timing_metrics"].items():
-        timing_table.add_row(stage.replace("_", " ").title(), f"{time_taken:.2f}")
-    console.print(timing_table)
-
-    # Test collaborative scene writing with advisor integration
-    console.print("\n[bold yellow]Testing Collaborative Scene Writing with Advisors[/bold yellow]")
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("[yellow]Generating collaborative scene...", total=100)
-
         def collaborative_progress_callback(current: int, total: int):
             status = (
                 "Ollama generating opening"
@@ -285,14 +248,46 @@ def test_enhanced_playwright_collaboration():
                 else "Getting opening feedback" if current == 2 else "Grok enhancing scene"
             )
             progress.update(
-                task, completed=int((current / total) * 100), description=f"[yellow]{status}"
+                task3, completed=int((current / total) * 100), description=f"[yellow]{status}"
+            )
+
+        # Test individual scene generation with advisor feedback
+        console.print(
+            "\n[bold yellow]Testing Individual Scene Generation with Advisors[/bold yellow]"
+        )
+
+        # Generate the Ollama and Grok scenes concurrently; neither depends on the other's result
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ollama_future = executor.submit(
+                ollama_playwright.generate_scene,
+                scene_requirements,
+                progress_callback=ollama_progress_callback,
             )
+            grok_future = executor.submit(
+                grok_playwright.generate_scene,
+                scene_requirements,
+                progress_callback=grok_progress_callback,
+            )
+            ollama_result = ollama_future.result()
+            progress.update(task1, completed=100, description="[green]Ollama: Complete")
+            grok_result = grok_future.result()
+            progress.update(task2, completed=100, description="[blue]Grok: Complete")
+
+        # Test collaborative scene writing with advisor integration
+        console.print("\n[bold yellow]Testing Collaborative Scene Writing with Advisors[/bold yellow]")
 
         # First playwright generates opening
         collaborative_result = ollama_playwright.collaborate_on_scene(
             grok_playwright, scene_requirements, progress_callback=collaborative_progress_callback
         )
-        progress.update(task, completed=100, description="[yellow]Collaborative: Complete")
+        progress.update(task3, completed=100, description="[yellow]Collaborative: Complete")
+
+    # Display individual scenes with advisor feedback
+    for name, result, border_style in (
+        ("Ollama", ollama_result, "green"),
+        ("Grok", grok_result, "blue"),
+    ):
+        _render_playwright_result(name, result, border_style)
 
     # Display collaborative scene with advisor feedback
     console.print("\n[bold cyan]Collaborative Scene:[/bold cyan]")
@@ -325,24 +320,17 @@ def test_enhanced_playwright_collaboration():
 
     # Verify all results contain required fields
     for result in [ollama_result, grok_result, collaborative_result]:
-        assert "scene" in result
-        assert "evaluation" in result
-        assert "timing_metrics" in result
-        assert "dialogue_history" in result
-        assert "iteration_metrics" in result
+        assert not _RESULT_KEYS - result.keys()
         assert isinstance(result["iteration_metrics"], list)
 
         # Verify iteration metrics structure
         for metric in result["iteration_metrics"]:
-            assert "iteration_number" in metric
-            assert "quality_scores" in metric
-            assert "significant_changes" in metric
-            assert "advisor_dialogues" in metric
-            assert "enhancement_time" in metric
+            assert not _ITERATION_METRIC_KEYS - metric.keys()
 
     console.print("\n[bold green]Test completed successfully![/bold green]")
 
 
+@pytest.mark.slow()
 def test_checkpoint_functionality():
     """Test the checkpoint functionality of EnhancedPlaywright."""
     console = Console()
@@ -433,6 +421,85 @@ def test_checkpoint_functionality():
     console.print("\n[bold green]Checkpoint test completed successfully![/bold green]")
 
 
+def test_scene_uniqueness_validation():
+    """Test that near-duplicate scene openings are rejected."""
+    playwright = Playwright(name="Uniqueness", llm_manager=LLMManager(), memory=TheatricalMemory())
+    lab_scene = (
+        "[SETTING: Laboratory with computers and holographic displays]\n"
+        "DR. SMITH: (looking at data streams) The neural pathway results are absolutely fascinating.\n"
+        "DR. JONES: (nodding) Yes, this breakthrough could change everything we know about consciousness."
+    )
+    boardroom_scene = (
+        "[SETTING: Corporate boardroom with panoramic city view]\n"
+        "CEO BROWN: (reviewing quarterly reports) The financial numbers exceeded all expectations this quarter.\n"
+        "CFO WHITE: (smiling confidently) Our strategic investments are paying significant dividends."
+    )
+
+    assert playwright._validate_scene_uniqueness(lab_scene, [])
+    assert not playwright._validate_scene_uniqueness(lab_scene, [boardroom_scene, lab_scene])
+    assert playwright._validate_scene_uniqueness(boardroom_scene, [lab_scene])
+    assert playwright._validate_scene_uniqueness("DR. SMITH: Hello.", [lab_scene])
+
+
+def test_astream_scene_generation_yields_progress_then_result():
+    """Test that progress events stream before the completed scene result."""
+
+    class StubPlaywright(Playwright):
+        def generate_scene(self, requirements, progress_callback=None, **kwargs):
+            progress_callback({"phase": "initial_generation", "message": "Drafting"})
+            progress_callback({"phase": "evaluation", "message": "Evaluating"})
+            return {"scene": "SCENE TEXT"}
+
+    playwright = StubPlaywright(name="Streaming", llm_manager=LLMManager(), memory=TheatricalMemory())
+
+    async def collect():
+        return [event async for event in playwright.astream_scene_generation(None)]
+
+    events = asyncio.run(collect())
+    assert [event["phase"] for event in events] == ["initial_generation", "evaluation", "complete"]
+    assert events[-1]["result"] == {"scene": "SCENE TEXT"}
+
+
+def test_advisor_analysis_runs_concurrently():
+    """Test that advisors are consulted in parallel and results keep advisor order."""
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def make_advisor(name, fail=False):
+        def analyze(content, context):
+            barrier.wait()  # Only passes if all three advisors run at once
+            if fail:
+                raise RuntimeError("advisor offline")
+            return AdvisorFeedback(score=0.8, feedback=name, suggestions=[], specific_examples=[], priority=1)
+        return SimpleNamespace(name=name, analyze=analyze)
+
+    manager = AdvisorManager(LLMManager(), TheatricalMemory())
+    manager.advisors = {}
+    for advisor in (make_advisor("pacing"), make_advisor("dialogue", fail=True), make_advisor("scenic")):
+        manager.register_advisor(advisor)
+
+    results = manager.run_analysis("SCENE", {})
+    assert list(results) == ["pacing", "dialogue", "scenic"]
+    assert results["scenic"].feedback == "scenic"
+    assert results["dialogue"].score == 0.5
+
+
+def test_scene_specific_directive_includes_generation_approach():
+    """Test that scene directives combine position, outline and generation type."""
+    playwright = Playwright(name="Directives", llm_manager=LLMManager(), memory=TheatricalMemory())
+    requirements = SceneRequirements(
+        setting="Lab", characters=["ARIA"], lighting="Bright", sound="Hum",
+        style="Drama", period="Future", target_audience="Adult", act_number=2, scene_number=3
+    )
+
+    directive = playwright._build_scene_specific_directive(requirements, "ARIA wakes up")
+    assert directive == "SCENE DIRECTIVE: MIDPOINT: Major reversal, revelation, or point of no return\nSCENE OUTLINE: ARIA wakes up\n"
+
+    playwright._current_generation_type = "collaborative"
+    directive = playwright._build_scene_specific_directive(requirements, "ARIA wakes up")
+    assert directive.endswith("\nGENERATION APPROACH: Emphasize dynamic character interactions and layered dialogue that reveals multiple perspectives.\n")
+
+
 if __name__ == "__main__":
     test_enhanced_playwright_collaboration()
     test_checkpoint_functionality()
@@ -3,6 +3,7 @@ Test script for production structure with acts and timing analysis.
 """
 
 import os
+import pytest
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.table import Table
@@ -14,7 +15,9 @@ from thespian.llm.production_structure import ProductionStructure, ActManager
 from thespian.llm.agent_personas import get_persona
 
 
-def main():
+@pytest.mark.slow()
+def test_production_structure():
+    """Generate every act of a production and render its timing analysis."""
     console = Console()
 
     # Initialize components
@@ -34,6 +37,8 @@ def main():
     # Initialize act manager and get persona
     act_manager = ActManager(llm_manager, memory)
     act_persona = get_persona("ActManager")
+    timing_persona = get_persona("TimingAdvisor")
+    dramatic_persona = get_persona("DramaticStructureAdvisor")
 
     # Display production info with act manager's persona
     console.print(
@@ -55,8 +60,6 @@ def main():
         console.print(f"Dramatic Arc: {act.dramatic_arc}")
         console.print(f"Target Duration: {act.target_duration} minutes")
 
-        # Get timing advisor persona
-        timing_persona = get_persona("TimingAdvisor")
         console.print(f"\n[dim italic]{timing_persona.name} adjusts her antique stopwatch...[/]")
 
         with Progress(
@@ -89,7 +92,6 @@ def main():
             console.print(f'[dim italic]"{timing_persona.catchphrase}"[/]')
 
             # Display scene summaries with dramatic flair
-            dramatic_persona = get_persona("DramaticStructureAdvisor")
             console.print(f"\n[italic]{dramatic_persona.name} reviews the dramatic structure...[/]")
             for scene in scenes:
                 console.print(
@@ -102,4 +104,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    test_production_structure()
@@ -0,0 +1,300 @@
+import asyncio
+import json
+import threading
+import time
+from collections import ChainMap
+import pytest
+from unittest.mock import MagicMock
+from thespian.llm import LLMManager
+from thespian.llm.consolidated_playwright import SceneRequirements, PlaywrightCapability
+from thespian.llm.enhanced_memory import EnhancedTheatricalMemory
+from thespian.llm.quantum_narrative import NarrativeQuantumState, QuantumNarrativeTree
+from thespian.llm.quantum_playwright import QuantumPlaywright, QuantumExplorationMode, _LazyDict, _parse_json_object
+
+STRUCTURAL_RESPONSE = json.dumps({
+    "tension_escalation": "HAMLET: (drawing his sword) Enough!",
+    "emotional_revelation": "OPHELIA: (weeping) I loved you once.",
+    "relationship_shift": "HORATIO: Then I am no longer your friend.",
+    "plot_advancement": "GHOST: The king must die tonight."
+})
+
+
+@pytest.fixture
+def requirements():
+    return SceneRequirements(
+        setting="Elsinore",
+        characters=["Hamlet"],
+        props=[],
+        lighting="Dim",
+        sound="Wind",
+        style="Tragedy",
+        period="1600",
+        target_audience="Adults",
+        act_number=1,
+        scene_number=2
+    )
+
+
+@pytest.fixture
+def quantum_playwright(monkeypatch):
+    playwright = QuantumPlaywright(
+        name="QuantumTest",
+        llm_manager=LLMManager(),
+        memory=EnhancedTheatricalMemory(),
+        enabled_capabilities=[PlaywrightCapability.BASIC, PlaywrightCapability.MEMORY_ENHANCEMENT]
+    )
+    mock_llm = MagicMock(spec=["invoke"])
+    mock_llm.invoke.return_value = MagicMock(content=STRUCTURAL_RESPONSE)
+    monkeypatch.setattr(QuantumPlaywright, "get_llm", lambda self: mock_llm)
+    playwright.enable_quantum_exploration(QuantumExplorationMode.STRUCTURAL_FOCUSED)
+    return playwright
+
+
+def test_parse_json_object_tolerates_preamble():
+    assert _parse_json_object('Here you go: {"a": "x"} Enjoy!') == {"a": "x"}
+    assert _parse_json_object('```json\n{"a": {"b": 1}}\n```') == {"a": {"b": 1}}
+    assert _parse_json_object("{not json} then {\"k\": 1}") == {"k": 1}
+    assert _parse_json_object("no json here") is None
+    assert _parse_json_object('{"tension_escalation": "HAMLET: Hi.\nOPHELIA: Bye."}') == {
+        "tension_escalation": "HAMLET: Hi.\nOPHELIA: Bye."
+    }
+    assert _parse_json_object('{"a": "x"}') is _parse_json_object('{"a": "x"}')
+
+
+def test_structural_branches_use_single_llm_call(quantum_playwright, requirements):
+    parent = NarrativeQuantumState(narrative_content="HAMLET: To be, or not to be.")
+    branches = asyncio.run(quantum_playwright._generate_structural_branches(parent, requirements))
+    assert quantum_playwright.llm_call_count == 1
+    assert [b.world_state["structural_focus"] for b in branches] == [
+        "tension_escalation", "emotional_revelation", "relationship_shift", "plot_advancement"
+    ]
+    assert branches[0].narrative_content == "HAMLET: (drawing his sword) Enough!"
+    assert all(b.parent_branch == parent.branch_id for b in branches)
+
+
+def test_extract_decision_context_collects_first_two_sentences(quantum_playwright, requirements):
+    branch = NarrativeQuantumState(
+        narrative_content="The night is cold. Should I stay or flee? Forget it. I must decide now. We choose later."
+    )
+    context = quantum_playwright._extract_decision_context(branch, "Hamlet", requirements)
+    assert context == "Should I stay or flee? Forget it. I must decide now"
+
+
+def test_extract_decision_context_falls_back_to_scene_position(quantum_playwright, requirements):
+    branch = NarrativeQuantumState(narrative_content="The night is cold. Fortune smiles.")
+    context = quantum_playwright._extract_decision_context(branch, "Hamlet", requirements)
+    assert context == "responding to the events in Act 1, Scene 2"
+
+
+def test_superposition_summary_lists_top_five_by_quality(quantum_playwright):
+    root = NarrativeQuantumState(narrative_content="Root", dramatic_tension=0.0)
+    quantum_playwright.quantum_tree = QuantumNarrativeTree(root_state=root, min_quality_threshold=0.0)
+    for i in range(1, 8):
+        branch = NarrativeQuantumState(
+            narrative_content=f"Branch {i}",
+            divergence_point=f"choice {i}",
+            dramatic_tension=i / 10
+        )
+        quantum_playwright.quantum_tree.add_branch(root.branch_id, branch)
+    
+    summary = quantum_playwright._create_superposition_summary()
+    listed = [line for line in summary.splitlines() if line[:2] in {"1.", "2.", "3.", "4.", "5.", "6."}]
+    assert [line.split(" (")[0] for line in listed] == [
+        "1. choice 7", "2. choice 6", "3. choice 5", "4. choice 4", "5. choice 3"
+    ]
+
+
+def test_content_preview_tracks_content_changes():
+    branch = NarrativeQuantumState(narrative_content="x" * 200)
+    assert branch.get_content_preview(150) == "x" * 150 + "..."
+    assert branch.get_content_preview(100) == "x" * 100 + "..."
+    branch.narrative_content = "short"
+    assert branch.get_content_preview(150) == "short"
+
+
+def test_overall_quality_tracks_score_changes():
+    branch = NarrativeQuantumState(dramatic_tension=0.0)
+    assert branch.calculate_overall_quality() == pytest.approx(0.4)
+    branch.dramatic_tension = 1.0
+    assert branch.calculate_overall_quality() == pytest.approx(0.6)
+
+
+def test_structural_branches_overlay_parent_world_state(quantum_playwright, requirements):
+    parent = NarrativeQuantumState(narrative_content="HAMLET: To be.", world_state={"setting": "Elsinore"})
+    branches = asyncio.run(quantum_playwright._generate_structural_branches(parent, requirements))
+    assert branches[0].world_state["setting"] == "Elsinore"
+    assert "structural_focus" not in parent.world_state
+    assert branches[0].model_dump()["world_state"] == {
+        "setting": "Elsinore", "structural_focus": "tension_escalation"
+    }
+    json.loads(branches[0].model_dump_json())
+
+
+def test_explore_skips_branches_below_min_quality(quantum_playwright, requirements):
+    root = NarrativeQuantumState(narrative_content="HAMLET: To be, or not to be.")
+    quantum_playwright.quantum_tree = QuantumNarrativeTree(root_state=root, min_quality_threshold=0.0)
+    quantum_playwright.min_branch_quality = 0.9
+    results = asyncio.run(quantum_playwright._explore_narrative_branches(requirements, None, None))
+    assert results["branches_generated"] == 0
+    assert list(quantum_playwright.quantum_tree.active_branches) == [root.branch_id]
+
+
+def test_tree_rejects_duplicate_branch_content():
+    root = NarrativeQuantumState(narrative_content="Root")
+    tree = QuantumNarrativeTree(root_state=root, min_quality_threshold=0.0)
+    first = NarrativeQuantumState(narrative_content="HAMLET: Enough!")
+    assert tree.add_branch(root.branch_id, first)
+    assert not tree.add_branch(root.branch_id, NarrativeQuantumState(narrative_content="HAMLET: Enough!"))
+    
+    tree._prune_branch(first.branch_id)
+    assert tree.add_branch(root.branch_id, NarrativeQuantumState(narrative_content="HAMLET: Enough!"))
+
+
+def test_explore_expands_frontier_breadth_first(quantum_playwright, requirements):
+    root = NarrativeQuantumState(narrative_content="HAMLET: To be, or not to be.")
+    quantum_playwright.quantum_tree = QuantumNarrativeTree(root_state=root, min_quality_threshold=0.0)
+    
+    asyncio.run(quantum_playwright._explore_narrative_branches(requirements, None, None))
+    assert quantum_playwright.llm_call_count == 1
+    assert len(root.child_branches) == 4
+    
+    # The next call expands the new children, not the root again
+    asyncio.run(quantum_playwright._explore_narrative_branches(requirements, None, None))
+    assert quantum_playwright.llm_call_count == 5
+    assert len(root.child_branches) == 4
+    assert {branch_id for branch_id, _ in quantum_playwright._branch_prefix_cache} == set(root.child_branches)
+
+
+def test_thematic_prompts_carry_scene_context_once(quantum_playwright, requirements, monkeypatch):
+    prompts = []
+    
+    class RecordingLLM:
+        def invoke(self, prompt):
+            prompts.append(prompt)
+            return "HAMLET: Enough."
+    
+    monkeypatch.setattr(QuantumPlaywright, "get_llm", lambda self: RecordingLLM())
+    parent = NarrativeQuantumState(narrative_content="HAMLET: To be, or not to be.", world_state={"omen": "ghost"})
+    asyncio.run(quantum_playwright._generate_thematic_branches(parent, requirements))
+    assert len(prompts) == 4
+    for prompt in prompts:
+        assert prompt.count("To be, or not to be") == 1
+        assert prompt.count('"omen"') == 1
+
+
+def test_exploration_timeout_keeps_frontier(quantum_playwright, requirements, monkeypatch):
+    class SlowLLM:
+        async def ainvoke(self, prompt):
+            await asyncio.sleep(1)
+    
+    root = NarrativeQuantumState(narrative_content="HAMLET: To be, or not to be.")
+    monkeypatch.setattr(QuantumPlaywright, "get_llm", lambda self: SlowLLM())
+    monkeypatch.setattr(QuantumPlaywright, "_create_initial_quantum_state", lambda self, req: root)
+    quantum_playwright.exploration_timeout = 0.05
+    
+    result = quantum_playwright.generate_scene_with_quantum_exploration(requirements)
+    assert result["quantum_metadata"]["branches_explored"] == 1
+    assert list(quantum_playwright._frontier) == [root.branch_id]
+
+
+def test_exploration_timeout_does_not_wait_for_blocking_backend(quantum_playwright, requirements, monkeypatch):
+    release = threading.Event()
+    
+    class BlockingLLM:
+        def invoke(self, prompt):
+            release.wait(5)
+    
+    root = NarrativeQuantumState(narrative_content="HAMLET: To be, or not to be.")
+    monkeypatch.setattr(QuantumPlaywright, "get_llm", lambda self: BlockingLLM())
+    monkeypatch.setattr(QuantumPlaywright, "_create_initial_quantum_state", lambda self, req: root)
+    quantum_playwright.exploration_timeout = 0.1
+    
+    start = time.perf_counter()
+    try:
+        result = quantum_playwright.generate_scene_with_quantum_exploration(requirements)
+        elapsed = time.perf_counter() - start
+    finally:
+        release.set()
+    assert elapsed == pytest.approx(0.1, abs=0.4)
+    assert result["quantum_metadata"]["branches_explored"] == 1
+    assert quantum_playwright._llm_executor is None
+
+
+def test_lazy_dict_computes_entries_once_on_access():
+    calls = []
+    
+    def factory():
+        calls.append(1)
+        return ["path"]
+    
+    result = _LazyDict({"scene": "text"}, lazy={"alternative_paths": factory})
+    assert "alternative_paths" in result
+    assert len(result) == 2
+    assert calls == []
+    assert result["alternative_paths"] == ["path"]
+    assert result.get("alternative_paths") == ["path"]
+    assert calls == [1]
+    
+    other = _LazyDict(lazy={"alternative_paths": factory})
+    assert json.loads(json.dumps(other)) == {"alternative_paths": ["path"]}
+    assert dict(_LazyDict(lazy={"a": lambda: 1})) == {"a": 1}
+    with pytest.raises(KeyError):
+        result["missing"]
+
+
+def test_lazy_dict_never_exposes_placeholders():
+    def make():
+        return _LazyDict({"setting": "Elsinore"}, lazy={"omen": lambda: "ghost"})
+    
+    expected = {"setting": "Elsinore", "omen": "ghost"}
+    assert make() == expected and expected == make() and not make() != expected
+    assert make().pop("omen") == "ghost"
+    assert make().popitem() == ("omen", "ghost")
+    assert list(make().values()) == ["Elsinore", "ghost"]
+    assert {**make()} == expected
+    assert make() | {"act": 1} == {**expected, "act": 1}
+    
+    world_state = make()
+    assert json.loads(json.dumps(world_state)) == expected
+    assert json.loads(json.dumps(dict(ChainMap({"structural_focus": "x"}, world_state)))) == {
+        **expected, "structural_focus": "x"
+    }
+
+
+def test_generation_tasks_respect_concurrency_limit(quantum_playwright):
+    in_flight = []
+    peak = []
+    
+    async def generate(value):
+        in_flight.append(value)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01 * (value % 3))
+        in_flight.remove(value)
+        return value
+    
+    quantum_playwright.max_concurrent_generations = 2
+    results = asyncio.run(quantum_playwright._run_generation_tasks([generate(i) for i in range(6)]))
+    assert results == list(range(6))
+    assert max(peak) == 2
+
+
+def test_generation_tasks_cancel_siblings_on_failure(quantum_playwright):
+    cancelled = []
+    
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+    
+    async def fail():
+        raise ValueError("backend down")
+    
+    async def run():
+        with pytest.raises(ValueError):
+            await quantum_playwright._run_generation_tasks([slow(), fail(), slow()])
+        # Siblings are already stopped when the error surfaces, not at loop shutdown
+        return list(cancelled)
+    
+    assert asyncio.run(run()) == [True, True]
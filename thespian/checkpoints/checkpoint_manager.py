@@ -4,10 +4,13 @@ Checkpoint manager for saving and restoring production state.
 
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 from pydantic import BaseModel, Field
+from pydantic_core import PydanticSerializationError
 import logging
 
 logger = logging.getLogger(__name__)
@@ -27,13 +30,15 @@ class Checkpoint(BaseModel):
 class CheckpointManager:
     """Manages saving and loading of production checkpoints."""
     
-    def __init__(self, checkpoint_dir: str = "checkpoints"):
+    def __init__(self, checkpoint_dir: str = "checkpoints", max_io_workers: int = 8):
         """Initialize checkpoint manager.
         
         Args:
             checkpoint_dir: Directory to store checkpoint files
+            max_io_workers: Maximum concurrent file writes in save_checkpoints_batch
         """
         self.checkpoint_dir = Path(checkpoint_dir)
+        self.max_io_workers = max_io_workers
         self.checkpoint_dir.mkdir(exist_ok=True)
         logger.info(f"Initialized checkpoint manager with directory: {self.checkpoint_dir}")
     
@@ -59,13 +64,8 @@ class CheckpointManager:
             metadata=metadata or {}
         )
         
-        filename = f"{checkpoint_id}.json"
-        filepath = self.checkpoint_dir / filename
-        
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(checkpoint.model_dump(), f, indent=2, default=str)
-            
+            filepath = self._write_checkpoint(checkpoint)
             logger.info(f"Saved checkpoint '{name}' to {filepath}")
             return str(filepath)
             
@@ -73,6 +73,51 @@ class CheckpointManager:
             logger.error(f"Failed to save checkpoint '{name}': {e}")
             raise
     
+    def save_checkpoints_batch(self, items: List[Tuple[str, str, Dict[str, Any]]]) -> List[str]:
+        """Save several checkpoints, writing their files concurrently.
+        
+        Args:
+            items: (checkpoint_id, name, data) tuples
+            
+        Returns:
+            Paths to the saved checkpoint files, in input order
+        """
+        checkpoints = [
+            Checkpoint(id=checkpoint_id, name=name, data=data)
+            for checkpoint_id, name, data in items
+        ]
+        if not checkpoints:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_io_workers, len(checkpoints))) as executor:
+            paths = [str(path) for path in executor.map(self._write_checkpoint, checkpoints)]
+        
+        logger.info(f"Saved {len(paths)} checkpoints to {self.checkpoint_dir}")
+        return paths
+    
+    def _write_checkpoint(self, checkpoint: Checkpoint) -> Path:
+        """Serialize a checkpoint and atomically replace its file."""
+        filepath = self.checkpoint_dir / f"{checkpoint.id}.json"
+        
+        # Serialize compactly in pydantic-core; fall back to json for data it cannot encode
+        try:
+            payload = checkpoint.model_dump_json().encode("utf-8")
+        except PydanticSerializationError:
+            payload = json.dumps(
+                checkpoint.model_dump(), separators=(",", ":"), default=str
+            ).encode("utf-8")
+        
+        # Write to a sibling temp file so readers never see a partial checkpoint
+        tmp_path = filepath.with_name(f"{filepath.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return filepath
+    
     def load_checkpoint(self, checkpoint_id: str) -> Optional[Checkpoint]:
         """Load a checkpoint by ID.
         
@@ -90,10 +135,7 @@ class CheckpointManager:
             return None
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            checkpoint = Checkpoint(**data)
+            checkpoint = Checkpoint.model_validate_json(filepath.read_bytes())
             logger.info(f"Loaded checkpoint '{checkpoint.name}' from {filepath}")
             return checkpoint
             
@@ -111,10 +153,7 @@ class CheckpointManager:
         
         for filepath in self.checkpoint_dir.glob("*.json"):
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                checkpoint = Checkpoint(**data)
-                checkpoints.append(checkpoint)
+                checkpoints.append(Checkpoint.model_validate_json(filepath.read_bytes()))
             except Exception as e:
                 logger.warning(f"Failed to load checkpoint from {filepath}: {e}")
         
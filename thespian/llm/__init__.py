@@ -2,6 +2,6 @@
 LLM integration module for Thespian framework.
 """
 
-from .manager import LLMManager
+from .manager import LLMManager, get_llm_manager
 
-__all__ = ["LLMManager"]
+__all__ = ["LLMManager", "get_llm_manager"]
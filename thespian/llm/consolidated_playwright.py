@@ -6,16 +6,19 @@ with modular capabilities including memory enhancement, iterative refinement, an
 advanced story structure awareness.
 """
 
-from typing import Dict, Any, List, Optional, Callable, Union, TypeVar, cast
-from pydantic import BaseModel, Field, ConfigDict
+from typing import Dict, Any, List, Optional, Callable, Union, TypeVar, cast, FrozenSet, AsyncIterator
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 from enum import Enum
 import logging
+import asyncio
 import time
 import json
 import uuid
 from datetime import datetime
 import os
 from pathlib import Path
+from functools import lru_cache
+from types import MappingProxyType
 
 from thespian.llm import LLMManager
 from thespian.llm.theatrical_memory import TheatricalMemory, CharacterProfile, StoryOutline
@@ -37,6 +40,61 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Prompt directives for each generation method, keyed by _current_generation_type
+_GENERATION_DIRECTIVES = MappingProxyType({
+    "basic": "Focus on clear, straightforward narrative progression with strong dialogue and action.",
+    "collaborative": "Emphasize dynamic character interactions and layered dialogue that reveals multiple perspectives.",
+    "character_focused": "Prioritize deep character development, internal monologue, and character-driven conflict.",
+    "memory_enhanced": "Incorporate rich continuity details, character history callbacks, and plot thread connections.",
+    "iterative_refinement": "Create sophisticated, nuanced scenes with complex subtext and artistic flourishes."
+})
+
+# Scene-specific directives for dramatic progression, keyed by act/scene position
+_SCENE_DIRECTIVES = MappingProxyType({
+    "act1_scene1": "OPENING SCENE: Establish the world, introduce main characters, set the premise",
+    "act1_scene2": "INCITING INCIDENT: Introduce the central conflict or challenge",
+    "act1_scene3": "FIRST PLOT POINT: Deepen the conflict, reveal character motivations",
+    "act1_scene4": "RISING ACTION: Escalate tensions, introduce complications",
+    "act1_scene5": "ACT ONE CLIMAX: Major revelation or turning point that propels us into Act 2",
+    "act2_scene1": "NEW CIRCUMSTANCES: Characters adapt to changed situation from Act 1",
+    "act2_scene2": "MIDPOINT BUILD: Increasing pressure and stakes",
+    "act2_scene3": "MIDPOINT: Major reversal, revelation, or point of no return",
+    "act2_scene4": "CRISIS ESCALATION: Everything falls apart, lowest point",
+    "act2_scene5": "SECOND PLOT POINT: Final push toward resolution, characters commit to final action",
+    "act3_scene1": "FINAL BATTLE: Climactic confrontation begins",
+    "act3_scene2": "CLIMAX: Peak of dramatic tension and conflict",
+    "act3_scene3": "FALLING ACTION: Immediate consequences of climax",
+    "act3_scene4": "RESOLUTION: Tying up loose ends, character arcs conclude",
+    "act3_scene5": "DENOUEMENT: Final state, new equilibrium, thematic statement"
+})
+
+
+@lru_cache(maxsize=128)
+def _compose_scene_directive(act_number: Optional[int], scene_number: Optional[int],
+                             scene_outline: str, generation_type_directive: str) -> str:
+    """Assemble the scene directive text for a scene position, outline and generation approach."""
+    scene_key = f"act{act_number}_scene{scene_number}"
+    base_directive = _SCENE_DIRECTIVES.get(scene_key, f"Continue the story progression for {scene_key}")
+    
+    directive = f"SCENE DIRECTIVE: {base_directive}\nSCENE OUTLINE: {scene_outline}\n"
+    if generation_type_directive:
+        directive += f"\nGENERATION APPROACH: {generation_type_directive}\n"
+    
+    return directive
+
+
+def _scene_opening_words(scene: str) -> Optional[FrozenSet[str]]:
+    """Lowercased word set of a scene's first 10 lines, or None if the opening is too short to compare."""
+    return _opening_signature_words(' '.join(scene.split('\n', 10)[:10]).lower())
+
+
+@lru_cache(maxsize=256)
+def _opening_signature_words(signature: str) -> Optional[FrozenSet[str]]:
+    """Word set for an opening signature, cached on the short signature rather than the full scene."""
+    if len(signature) <= 100:
+        return None
+    return frozenset(signature.split())
+
 class IterationMetrics(BaseModel):
     """Metrics for a single iteration of scene enhancement."""
     iteration_number: int
@@ -197,7 +255,7 @@ class Playwright(BaseModel):
     memory_integration_level: int = Field(default=2, ge=1, le=3)  # 1=basic, 2=standard, 3=deep
 
     # Generation control
-    _generation_cancelled: bool = Field(default=False, exclude=True)
+    _generation_cancelled: bool = PrivateAttr(default=False)
 
     def __init__(self, **data: Any) -> None:
         """Initialize the playwright with appropriate components."""
@@ -625,6 +683,46 @@ class Playwright(BaseModel):
             "evaluation": evaluation,  # Include full evaluation for reference
         }
 
+    async def astream_scene_generation(
+        self,
+        requirements: SceneRequirements,
+        **kwargs: Any
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate a scene in the background, yielding progress events as they happen.
+
+        The final event has phase "complete" and carries the generate_scene result
+        under "result", so consumers can render progress concurrently with generation.
+
+        Args:
+            requirements: Scene requirements
+            **kwargs: Additional generate_scene arguments (except progress_callback)
+
+        Yields:
+            Progress event dicts, followed by the completion event
+        """
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+        finished = object()
+
+        def progress_callback(data: Dict[str, Any]) -> None:
+            # Called from the executor thread; hand the event to the event loop
+            loop.call_soon_threadsafe(events.put_nowait, data)
+
+        generation = loop.run_in_executor(
+            None,
+            lambda: self.generate_scene(requirements, progress_callback=progress_callback, **kwargs)
+        )
+        generation.add_done_callback(lambda _: events.put_nowait(finished))
+
+        while True:
+            event = await events.get()
+            if event is finished:
+                break
+            yield event
+
+        yield {"phase": "complete", "result": generation.result()}
+
     def _generate_initial_scene(
         self, 
         requirements: SceneRequirements, 
@@ -855,50 +953,18 @@ Please provide a complete scene with:
     
     def _build_scene_specific_directive(self, requirements: SceneRequirements, scene_outline: str) -> str:
         """Build scene-specific directive based on context."""
-        scene_key = f"act{requirements.act_number}_scene{requirements.scene_number}"
-        
-        # Scene-specific directives for dramatic progression
-        directives = {
-            "act1_scene1": "OPENING SCENE: Establish the world, introduce main characters, set the premise",
-            "act1_scene2": "INCITING INCIDENT: Introduce the central conflict or challenge",
-            "act1_scene3": "FIRST PLOT POINT: Deepen the conflict, reveal character motivations",
-            "act1_scene4": "RISING ACTION: Escalate tensions, introduce complications",
-            "act1_scene5": "ACT ONE CLIMAX: Major revelation or turning point that propels us into Act 2",
-            "act2_scene1": "NEW CIRCUMSTANCES: Characters adapt to changed situation from Act 1",
-            "act2_scene2": "MIDPOINT BUILD: Increasing pressure and stakes",
-            "act2_scene3": "MIDPOINT: Major reversal, revelation, or point of no return",
-            "act2_scene4": "CRISIS ESCALATION: Everything falls apart, lowest point",
-            "act2_scene5": "SECOND PLOT POINT: Final push toward resolution, characters commit to final action",
-            "act3_scene1": "FINAL BATTLE: Climactic confrontation begins",
-            "act3_scene2": "CLIMAX: Peak of dramatic tension and conflict",
-            "act3_scene3": "FALLING ACTION: Immediate consequences of climax",
-            "act3_scene4": "RESOLUTION: Tying up loose ends, character arcs conclude",
-            "act3_scene5": "DENOUEMENT: Final state, new equilibrium, thematic statement"
-        }
-        
-        base_directive = directives.get(scene_key, f"Continue the story progression for {scene_key}")
-        
-        # Add generation type specific directive if available
-        generation_type_directive = self._get_generation_type_directive()
-        
-        directive = f"SCENE DIRECTIVE: {base_directive}\nSCENE OUTLINE: {scene_outline}\n"
-        if generation_type_directive:
-            directive += f"\nGENERATION APPROACH: {generation_type_directive}\n"
-        
-        return directive
+        return _compose_scene_directive(
+            requirements.act_number,
+            requirements.scene_number,
+            scene_outline,
+            self._get_generation_type_directive()
+        )
     
     def _get_generation_type_directive(self) -> str:
         """Get generation-type specific directive based on current context."""
         # This would be set by different generation methods
         if hasattr(self, '_current_generation_type'):
-            generation_directives = {
-                "basic": "Focus on clear, straightforward narrative progression with strong dialogue and action.",
-                "collaborative": "Emphasize dynamic character interactions and layered dialogue that reveals multiple perspectives.",
-                "character_focused": "Prioritize deep character development, internal monologue, and character-driven conflict.",
-                "memory_enhanced": "Incorporate rich continuity details, character history callbacks, and plot thread connections.",
-                "iterative_refinement": "Create sophisticated, nuanced scenes with complex subtext and artistic flourishes."
-            }
-            return generation_directives.get(self._current_generation_type, "")
+            return _GENERATION_DIRECTIVES.get(self._current_generation_type, "")
         return ""
     
     def _validate_scene_uniqueness(self, new_scene: str, previous_scenes: List[str], similarity_threshold: float = 0.6) -> bool:
@@ -906,21 +972,26 @@ Please provide a complete scene with:
         if not previous_scenes:
             return True
         
-        # Simple similarity check based on first few lines and dialogue patterns
-        new_scene_start = new_scene.split('\n')[:10]  # First 10 lines
-        new_scene_signature = ' '.join(new_scene_start).lower()
+        # Simple similarity check based on first few lines and dialogue patterns;
+        # opening word sets are cached, so previous scenes are tokenized only once
+        new_words = _scene_opening_words(new_scene)
+        if new_words is None:
+            return True  # Too short to compare openings
         
         for prev_scene in previous_scenes:
-            prev_scene_start = prev_scene.split('\n')[:10]  # First 10 lines
-            prev_scene_signature = ' '.join(prev_scene_start).lower()
+            prev_words = _scene_opening_words(prev_scene)
             
             # Check for very similar openings
-            if len(new_scene_signature) > 100 and len(prev_scene_signature) > 100:
-                # Simple Jaccard similarity on words
-                new_words = set(new_scene_signature.split())
-                prev_words = set(prev_scene_signature.split())
+            if prev_words is not None:
+                # Jaccard similarity is at most min/max of the set sizes, so skip pairs
+                # whose vocabulary sizes alone rule out exceeding the threshold
+                smaller, larger = sorted((len(new_words), len(prev_words)))
+                if smaller <= similarity_threshold * larger:
+                    continue
+                
+                # Simple Jaccard similarity on words; the union size follows from the counts
                 intersection = len(new_words.intersection(prev_words))
-                union = len(new_words.union(prev_words))
+                union = len(new_words) + len(prev_words) - intersection
                 similarity = intersection / union if union > 0 else 0
                 
                 if similarity > similarity_threshold:
@@ -3,14 +3,14 @@ Enhanced memory system for theatrical productions with better character and narr
 """
 
 from typing import Dict, Any, List, Optional, Union, Set
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 from datetime import datetime
 import logging
 import json
 import os
 from pathlib import Path
 
-from thespian.llm.theatrical_memory import TheatricalMemory, CharacterProfile, StoryOutline
+from thespian.llm.theatrical_memory import TheatricalMemory, CharacterProfile, StoryOutline, SceneData
 
 logger = logging.getLogger(__name__)
 
@@ -341,7 +341,9 @@ class EnhancedTheatricalMemory(TheatricalMemory):
     continuity_tracker: NarrativeContinuityTracker = Field(default_factory=NarrativeContinuityTracker)
     story_arcs: Dict[str, List[Dict[str, Any]]] = Field(default_factory=dict)
     scene_analysis: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+    scene_index: Dict[int, List[str]] = Field(default_factory=dict)  # act_number -> scene ids
     character_db_path: Optional[str] = Field(default=None)
+    _scene_ids: Set[str] = PrivateAttr(default_factory=set)
     
     def __init__(self, db_path: Optional[str] = None, **data):
         """Initialize the memory system."""
@@ -349,6 +351,7 @@ class EnhancedTheatricalMemory(TheatricalMemory):
             data['db_path'] = db_path
         super().__init__(**data)
         self.continuity_tracker = NarrativeContinuityTracker()
+        self._scene_ids = {scene.id for scene in self.scenes}
         
         # If using the default file path, convert to enhanced profiles
         if hasattr(self, '_db_path') and self._db_path and os.path.exists(self._db_path):
@@ -763,6 +766,47 @@ Please provide ONLY valid JSON with NO additional text. The response must be a s
             "thematic_status": themes
         }
     
+    def add_scene_to_memory(self,
+                            scene_id: str,
+                            act_number: int,
+                            scene_number: int,
+                            content: str,
+                            characters: Optional[List[str]] = None) -> None:
+        """Store a generated scene and index it under its act."""
+        if scene_id in self._scene_ids:
+            return
+        self.add_scene(SceneData(
+            id=scene_id,
+            act_number=act_number,
+            scene_number=scene_number,
+            content=content,
+            evaluation={"characters": characters or []},
+            timing_metrics={},
+            iterations=0,
+            iteration_metrics={},
+            timestamp=datetime.now().isoformat()
+        ))
+        self.index_scene(scene_id, act_number)
+    
+    def add_scene(self, scene: SceneData) -> None:
+        """Add a scene and record its id for membership checks."""
+        super().add_scene(scene)
+        self._scene_ids.add(scene.id)
+    
+    def index_scene(self, scene_id: str, act_number: int) -> None:
+        """Record the scene to act mapping without storing scene content."""
+        act_scenes = self.scene_index.setdefault(act_number, [])
+        if scene_id not in act_scenes:
+            act_scenes.append(scene_id)
+    
+    def has_scene(self, scene_id: str) -> bool:
+        """Check whether a scene has already been stored in memory."""
+        return scene_id in self._scene_ids
+    
+    def get_scene_count(self) -> int:
+        """Get the number of scenes stored in memory."""
+        return len(self._scene_ids)
+    
     def store_character_analysis(self, scene_id: str, character_name: str, analysis: Dict[str, Any]) -> None:
         """Store character analysis for a scene."""
         if scene_id not in self.scene_analysis:
@@ -3,6 +3,8 @@ LLM manager for handling different language models.
 """
 
 import os
+import threading
+from functools import lru_cache
 from typing import Dict, Any, Optional
 import requests
 import httpx
@@ -57,14 +59,29 @@ class LLMResponse:
 class OllamaLLM:
     """Ollama LLM integration."""
 
-    def __init__(self, base_url: str = "http://localhost:11434"):
+    def __init__(self, base_url: str = "http://localhost:11434", timeout: float = 300.0):
         self.base_url = base_url
+        self.timeout = timeout
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """Connection-pooling session for the calling thread.
+
+        requests.Session is not documented as thread-safe and this backend is called
+        from thread pools, so each thread reuses its own session.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
 
     def invoke(self, prompt: str) -> LLMResponse:
         """Generate a response using Ollama."""
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/api/generate",
             json={"model": "long-gemma", "prompt": prompt, "stream": False},
+            timeout=self.timeout,
         )
         response.raise_for_status()
         return LLMResponse(response.json()["response"])
@@ -73,7 +90,12 @@ class OllamaLLM:
 class GrokLLM:
     """Grok LLM integration using OpenAI protocol."""
 
-    def __init__(self, api_key: Optional[str] = None, api_base: str = "https://api.x.ai/v1"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_base: str = "https://api.x.ai/v1",
+        timeout: float = 300.0,
+    ):
         self.api_key = api_key or os.getenv("XAI_API_KEY")
         self.api_base = api_base
         self.client = None
@@ -82,7 +104,10 @@ class GrokLLM:
                 self.client = OpenAI(
                     api_key=self.api_key,
                     base_url=api_base,
-                    http_client=httpx.Client(),  # Use default client without proxies
+                    timeout=timeout,
+                    http_client=httpx.Client(  # Use default client without proxies
+                        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+                    ),
                 )
             except Exception as e:
                 print(f"Warning: Failed to initialize Grok client: {e}")
@@ -227,3 +252,9 @@ class LLMManager(BaseModel):
         except Exception as e:
             logger.error(f"Error generating text: {str(e)}")
             raise
+
+
+@lru_cache(maxsize=1)
+def get_llm_manager() -> LLMManager:
+    """Get a process-wide LLMManager so callers share its HTTP connection pools."""
+    return LLMManager()
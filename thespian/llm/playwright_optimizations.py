@@ -123,10 +123,12 @@ class ContentValidator:
         elif len(content) > 50000:
             warnings.append("Scene content is very long")
             
+        # Lowercase once for all case-insensitive containment checks
+        content_lower = content.lower()
+        
         # Required characters check (optimized)
         required_chars = requirements.get('characters', [])
         if required_chars:
-            content_lower = content.lower()
             missing_chars = [char for char in required_chars 
                            if char.lower() not in content_lower]
             if missing_chars:
@@ -134,7 +136,7 @@ class ContentValidator:
                 
         # Setting validation
         required_setting = requirements.get('setting')
-        if required_setting and required_setting.lower() not in content.lower():
+        if required_setting and required_setting.lower() not in content_lower:
             warnings.append("Setting may not be properly established")
             
         return {
@@ -7,7 +7,7 @@ character choices or dramatic necessities force collapse into a single path.
 """
 
 from typing import Dict, Any, List, Optional, Union, Callable, Set, Tuple
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, field_serializer
 from enum import Enum
 import logging
 import json
@@ -17,12 +17,22 @@ import math
 from datetime import datetime
 from collections import defaultdict
 import hashlib
+import asyncio
 
 from thespian.llm.enhanced_memory import EnhancedTheatricalMemory, EnhancedCharacterProfile
 from thespian.llm.theatrical_memory import StoryOutline
 
 logger = logging.getLogger(__name__)
 
+# Weights for NarrativeQuantumState.calculate_overall_quality
+_QUALITY_WEIGHTS = {
+    'emotional_resonance': 0.25,
+    'thematic_alignment': 0.20,
+    'dramatic_tension': 0.20,
+    'character_consistency': 0.20,
+    'narrative_coherence': 0.15
+}
+
 class DivergenceType(str, Enum):
     """Types of narrative divergence points."""
     CHARACTER_DECISION = "character_decision"
@@ -44,6 +54,10 @@ class CollapseTriggerType(str, Enum):
     AUDIENCE_FEEDBACK = "audience_feedback"
     HUMAN_DECISION = "human_decision"
 
+def _content_digest(branch: "NarrativeQuantumState") -> bytes:
+    """Short digest of a branch's opening content for duplicate detection."""
+    return hashlib.blake2b(branch.narrative_content[:500].encode("utf-8"), digest_size=8).digest()
+
 class NarrativeQuantumState(BaseModel):
     """Represents a single narrative possibility in quantum superposition."""
     
@@ -66,7 +80,7 @@ class NarrativeQuantumState(BaseModel):
     
     # State tracking
     character_states: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
-    world_state: Dict[str, Any] = Field(default_factory=dict)
+    world_state: Dict[str, Any] = Field(default_factory=dict)  # May be a ChainMap overlay on the parent's
     relationship_matrix: Dict[str, Dict[str, float]] = Field(default_factory=dict)
     
     # Divergence information
@@ -87,29 +101,55 @@ class NarrativeQuantumState(BaseModel):
     creative_risk_level: float = Field(default=0.5, ge=0.0, le=1.0)
     innovation_score: float = Field(default=0.5, ge=0.0, le=1.0)
     
+    # Truncated previews by length, valid while narrative_content is unchanged
+    _preview_source: Optional[str] = PrivateAttr(default=None)
+    _previews: Dict[int, str] = PrivateAttr(default_factory=dict)
+    
+    # Overall quality, valid while the scores it was computed from are unchanged
+    _quality_key: Optional[Tuple[float, ...]] = PrivateAttr(default=None)
+    _quality: float = PrivateAttr(default=0.0)
+    
+    @field_serializer('world_state')
+    def _serialize_world_state(self, world_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten ChainMap overlays into a plain dict for serialization."""
+        return dict(world_state)
+    
+    def get_content_preview(self, length: int = 150) -> str:
+        """Get narrative content truncated to length, computed once per content."""
+        content = self.narrative_content
+        if self._preview_source is not content:
+            self._preview_source = content
+            self._previews = {}
+        
+        preview = self._previews.get(length)
+        if preview is None:
+            preview = content[:length] + "..." if len(content) > length else content
+            self._previews[length] = preview
+        return preview
+    
     def add_exploration_note(self, note: str) -> None:
         """Add a note about this branch's exploration."""
         self.exploration_notes.append(f"{datetime.now().isoformat()}: {note}")
     
     def calculate_overall_quality(self) -> float:
-        """Calculate weighted overall quality score."""
-        weights = {
-            'emotional_resonance': 0.25,
-            'thematic_alignment': 0.20,
-            'dramatic_tension': 0.20,
-            'character_consistency': 0.20,
-            'narrative_coherence': 0.15
-        }
-        
-        quality_score = (
-            self.emotional_resonance * weights['emotional_resonance'] +
-            self.thematic_alignment * weights['thematic_alignment'] +
-            self.dramatic_tension * weights['dramatic_tension'] +
-            self.character_consistency * weights['character_consistency'] +
-            self.narrative_coherence * weights['narrative_coherence']
+        """Calculate weighted overall quality score, cached until a score changes."""
+        key = (
+            self.emotional_resonance,
+            self.thematic_alignment,
+            self.dramatic_tension,
+            self.character_consistency,
+            self.narrative_coherence
         )
-        
-        return quality_score
+        if self._quality_key != key:
+            self._quality_key = key
+            self._quality = (
+                self.emotional_resonance * _QUALITY_WEIGHTS['emotional_resonance'] +
+                self.thematic_alignment * _QUALITY_WEIGHTS['thematic_alignment'] +
+                self.dramatic_tension * _QUALITY_WEIGHTS['dramatic_tension'] +
+                self.character_consistency * _QUALITY_WEIGHTS['character_consistency'] +
+                self.narrative_coherence * _QUALITY_WEIGHTS['narrative_coherence']
+            )
+        return self._quality
     
     def get_content_hash(self) -> str:
         """Generate hash of narrative content for deduplication."""
@@ -205,12 +245,16 @@ class QuantumNarrativeTree(BaseModel):
     exploration_history: List[Dict[str, Any]] = Field(default_factory=list)
     performance_metrics: Dict[str, float] = Field(default_factory=dict)
     
+    # Short content digests of active branches, for duplicate detection
+    _content_hashes: Dict[bytes, str] = PrivateAttr(default_factory=dict)
+    
     def __init__(self, **data):
         super().__init__(**data)
         
         # Initialize with root state in active branches
         if self.root_state:
             self.active_branches[self.root_state.branch_id] = self.root_state
+            self._content_hashes[_content_digest(self.root_state)] = self.root_state.branch_id
         
         # Set up default generation strategies
         if not self.generation_strategies:
@@ -288,8 +332,15 @@ class QuantumNarrativeTree(BaseModel):
     
     def add_branch(self, 
                    parent_branch_id: str, 
-                   new_branch: NarrativeQuantumState) -> bool:
-        """Add a new branch to the tree."""
+                   new_branch: NarrativeQuantumState,
+                   quality: Optional[float] = None) -> bool:
+        """Add a new branch to the tree.
+        
+        Args:
+            parent_branch_id: ID of the branch to attach under
+            new_branch: Branch to add
+            quality: Precomputed overall quality of new_branch, if the caller has it
+        """
         if parent_branch_id not in self.active_branches:
             logger.warning(f"Parent branch {parent_branch_id} not found in active branches")
             return False
@@ -304,10 +355,19 @@ class QuantumNarrativeTree(BaseModel):
             return False
         
         # Check quality threshold
-        if new_branch.calculate_overall_quality() < self.min_quality_threshold:
+        if quality is None:
+            quality = new_branch.calculate_overall_quality()
+        if quality < self.min_quality_threshold:
             logger.info(f"Branch {new_branch.branch_id} below quality threshold, not adding")
             return False
         
+        # Skip branches whose content duplicates an active branch
+        content_digest = _content_digest(new_branch)
+        if content_digest in self._content_hashes:
+            logger.info(f"Branch {new_branch.branch_id} duplicates branch {self._content_hashes[content_digest]}, not adding")
+            return False
+        self._content_hashes[content_digest] = new_branch.branch_id
+        
         # Add to parent's children
         self.active_branches[parent_branch_id].child_branches.append(new_branch.branch_id)
         
@@ -358,6 +418,9 @@ class QuantumNarrativeTree(BaseModel):
         
         # Remove from active branches
         del self.active_branches[branch_id]
+        content_digest = _content_digest(branch)
+        if self._content_hashes.get(content_digest) == branch_id:
+            del self._content_hashes[content_digest]
         
         # Remove from parent's children list
         if branch.parent_branch and branch.parent_branch in self.active_branches:
@@ -504,7 +567,7 @@ class QuantumNarrativeTree(BaseModel):
         def export_branch(branch: NarrativeQuantumState) -> Dict[str, Any]:
             return {
                 "id": branch.branch_id,
-                "content_preview": branch.narrative_content[:100] + "..." if len(branch.narrative_content) > 100 else branch.narrative_content,
+                "content_preview": branch.get_content_preview(100),
                 "divergence_type": branch.divergence_type,
                 "divergence_point": branch.divergence_point,
                 "quality_score": branch.calculate_overall_quality(),
@@ -552,40 +615,84 @@ class QuantumBranchGenerator:
         for prompt_type, prompt in psychology_prompts.items():
             try:
                 response = llm_invoke_func(prompt)
-                response_text = str(response.content if hasattr(response, "content") else response)
-                
-                # Create new branch
-                new_branch = NarrativeQuantumState(
-                    narrative_content=response_text,
-                    divergence_point=f"{character_name} {prompt_type} response to {decision_context}",
-                    divergence_type=DivergenceType.CHARACTER_DECISION,
-                    divergence_description=f"Character responds based on {prompt_type}",
-                    parent_branch=current_state.branch_id,
-                    depth_level=current_state.depth_level + 1
-                )
-                
-                # Set character state
-                new_branch.character_states[char_id] = {
-                    "psychological_state": prompt_type,
-                    "decision_rationale": f"Acting from {prompt_type}",
-                    "emotional_state": self._infer_emotional_state(prompt_type),
-                    "character_growth": f"Expressing {prompt_type} aspect of personality"
-                }
-                
-                # Calculate quality metrics
-                new_branch.character_consistency = self._evaluate_character_consistency(new_branch, profile)
-                new_branch.emotional_resonance = self._evaluate_emotional_resonance(new_branch, prompt_type)
-                new_branch.probability_weight = self._calculate_psychology_probability(prompt_type, profile)
-                
-                new_branch.add_exploration_note(f"Generated from {prompt_type} psychological response")
-                
-                branches.append(new_branch)
-                
+                branches.append(self._build_psychology_branch(
+                    character_name, decision_context, current_state, profile, prompt_type, response
+                ))
             except Exception as e:
                 self.logger.error(f"Error generating {prompt_type} branch: {str(e)}")
         
         return branches
     
+    async def agenerate_character_psychology_branches(self,
+                                                    character_name: str,
+                                                    decision_context: str,
+                                                    current_state: NarrativeQuantumState,
+                                                    allm_invoke_func: Callable) -> List[NarrativeQuantumState]:
+        """Generate character psychology branches with concurrent LLM calls."""
+        char_id = character_name.lower().replace(" ", "_")
+        profile = self.memory.get_character_profile(char_id)
+        
+        if not profile:
+            self.logger.warning(f"No profile found for character {character_name}")
+            return []
+        
+        psychology_prompts = self._create_psychology_prompts(character_name, decision_context, profile)
+        responses = await asyncio.gather(
+            *(allm_invoke_func(prompt) for prompt in psychology_prompts.values()),
+            return_exceptions=True
+        )
+        
+        branches = []
+        for prompt_type, response in zip(psychology_prompts, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                branches.append(self._build_psychology_branch(
+                    character_name, decision_context, current_state, profile, prompt_type, response
+                ))
+            except Exception as e:
+                self.logger.error(f"Error generating {prompt_type} branch: {str(e)}")
+        
+        return branches
+    
+    def _build_psychology_branch(self,
+                                 character_name: str,
+                                 decision_context: str,
+                                 current_state: NarrativeQuantumState,
+                                 profile: EnhancedCharacterProfile,
+                                 prompt_type: str,
+                                 response: Any) -> NarrativeQuantumState:
+        """Build a character psychology branch from an LLM response."""
+        char_id = character_name.lower().replace(" ", "_")
+        response_text = str(response.content if hasattr(response, "content") else response)
+        
+        # Create new branch
+        new_branch = NarrativeQuantumState(
+            narrative_content=response_text,
+            divergence_point=f"{character_name} {prompt_type} response to {decision_context}",
+            divergence_type=DivergenceType.CHARACTER_DECISION,
+            divergence_description=f"Character responds based on {prompt_type}",
+            parent_branch=current_state.branch_id,
+            depth_level=current_state.depth_level + 1
+        )
+        
+        # Set character state
+        new_branch.character_states[char_id] = {
+            "psychological_state": prompt_type,
+            "decision_rationale": f"Acting from {prompt_type}",
+            "emotional_state": self._infer_emotional_state(prompt_type),
+            "character_growth": f"Expressing {prompt_type} aspect of personality"
+        }
+        
+        # Calculate quality metrics
+        new_branch.character_consistency = self._evaluate_character_consistency(new_branch, profile)
+        new_branch.emotional_resonance = self._evaluate_emotional_resonance(new_branch, prompt_type)
+        new_branch.probability_weight = self._calculate_psychology_probability(prompt_type, profile)
+        
+        new_branch.add_exploration_note(f"Generated from {prompt_type} psychological response")
+        
+        return new_branch
+    
     def _create_psychology_prompts(self, 
                                   character_name: str, 
                                   decision_context: str, 
@@ -753,48 +860,94 @@ Generate 200-400 words of scene content with dialogue and stage directions."""
         for theme_type, prompt in thematic_prompts.items():
             try:
                 response = llm_invoke_func(prompt)
-                response_text = str(response.content if hasattr(response, "content") else response)
-                
-                # Create new branch
-                new_branch = NarrativeQuantumState(
-                    narrative_content=response_text,
-                    divergence_point=f"Thematic exploration: {theme_type}",
-                    divergence_type=DivergenceType.THEMATIC_EXPLORATION,
-                    divergence_description=f"Scene explores {theme_type} thematic direction",
-                    parent_branch=current_state.branch_id,
-                    depth_level=current_state.depth_level + 1
-                )
-                
-                # Set thematic focus in world state
-                new_branch.world_state.update({
-                    "dominant_theme": theme_type,
-                    "thematic_tension": thematic_tension,
-                    "philosophical_stance": self._extract_philosophical_stance(theme_type),
-                    "thematic_development": f"Exploring {theme_type} implications"
-                })
-                
-                # Calculate quality metrics
-                new_branch.thematic_alignment = self._evaluate_thematic_alignment(new_branch, theme_type)
-                new_branch.innovation_score = self._evaluate_thematic_innovation(new_branch, theme_type)
-                new_branch.probability_weight = self._calculate_thematic_probability(theme_type)
-                
-                new_branch.add_exploration_note(f"Thematic exploration of {theme_type}")
-                
-                branches.append(new_branch)
-                
+                branches.append(self._build_thematic_branch(
+                    thematic_tension, current_state, theme_type, response
+                ))
+            except Exception as e:
+                self.logger.error(f"Error generating thematic branch {theme_type}: {str(e)}")
+        
+        return branches
+    
+    async def agenerate_thematic_exploration_branches(self,
+                                                    thematic_tension: str,
+                                                    current_state: NarrativeQuantumState,
+                                                    allm_invoke_func: Callable,
+                                                    include_scene_context: bool = True) -> List[NarrativeQuantumState]:
+        """Generate thematic branches with concurrent LLM calls.
+        
+        Args:
+            include_scene_context: Pass False when allm_invoke_func already prefixes
+                each prompt with the scene excerpt and world state
+        """
+        thematic_prompts = self._create_thematic_prompts(
+            thematic_tension, current_state, include_scene_context=include_scene_context
+        )
+        responses = await asyncio.gather(
+            *(allm_invoke_func(prompt) for prompt in thematic_prompts.values()),
+            return_exceptions=True
+        )
+        
+        branches = []
+        for theme_type, response in zip(thematic_prompts, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                branches.append(self._build_thematic_branch(
+                    thematic_tension, current_state, theme_type, response
+                ))
             except Exception as e:
                 self.logger.error(f"Error generating thematic branch {theme_type}: {str(e)}")
         
         return branches
     
-    def _create_thematic_prompts(self, thematic_tension: str, current_state: NarrativeQuantumState) -> Dict[str, str]:
+    def _build_thematic_branch(self,
+                               thematic_tension: str,
+                               current_state: NarrativeQuantumState,
+                               theme_type: str,
+                               response: Any) -> NarrativeQuantumState:
+        """Build a thematic exploration branch from an LLM response."""
+        response_text = str(response.content if hasattr(response, "content") else response)
+        
+        # Create new branch
+        new_branch = NarrativeQuantumState(
+            narrative_content=response_text,
+            divergence_point=f"Thematic exploration: {theme_type}",
+            divergence_type=DivergenceType.THEMATIC_EXPLORATION,
+            divergence_description=f"Scene explores {theme_type} thematic direction",
+            parent_branch=current_state.branch_id,
+            depth_level=current_state.depth_level + 1
+        )
+        
+        # Set thematic focus in world state
+        new_branch.world_state.update({
+            "dominant_theme": theme_type,
+            "thematic_tension": thematic_tension,
+            "philosophical_stance": self._extract_philosophical_stance(theme_type),
+            "thematic_development": f"Exploring {theme_type} implications"
+        })
+        
+        # Calculate quality metrics
+        new_branch.thematic_alignment = self._evaluate_thematic_alignment(new_branch, theme_type)
+        new_branch.innovation_score = self._evaluate_thematic_innovation(new_branch, theme_type)
+        new_branch.probability_weight = self._calculate_thematic_probability(theme_type)
+        
+        new_branch.add_exploration_note(f"Thematic exploration of {theme_type}")
+        
+        return new_branch
+    
+    def _create_thematic_prompts(self,
+                                 thematic_tension: str,
+                                 current_state: NarrativeQuantumState,
+                                 include_scene_context: bool = True) -> Dict[str, str]:
         """Create prompts for different thematic explorations."""
         
-        base_context = f"""Current narrative context:
+        base_context = f"Central thematic tension: {thematic_tension}"
+        if include_scene_context:
+            base_context = f"""Current narrative context:
 {current_state.narrative_content[:500]}...
 
-Central thematic tension: {thematic_tension}
-Current world state: {json.dumps(current_state.world_state, indent=2)}"""
+{base_context}
+Current world state: {json.dumps(dict(current_state.world_state), indent=2)}"""
 
         # Extract opposing concepts from thematic tension
         if "vs" in thematic_tension or "versus" in thematic_tension:
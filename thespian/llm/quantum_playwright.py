@@ -5,13 +5,20 @@ This module extends the base Playwright class with quantum narrative functionali
 allowing exploration of multiple story possibilities before committing to a single path.
 """
 
-from typing import Dict, Any, List, Optional, Callable, Union, Tuple
-from pydantic import BaseModel, Field, ConfigDict
+from typing import Dict, Any, List, Optional, Callable, Union, Tuple, Deque, Awaitable, Mapping, Set
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 from enum import Enum
 import logging
 import json
+import re
 import time
+import asyncio
+import heapq
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from collections import ChainMap, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from thespian.llm.consolidated_playwright import Playwright, PlaywrightCapability, SceneRequirements
 from thespian.llm.quantum_narrative import (
@@ -27,6 +34,173 @@ from thespian.llm import LLMManager
 
 logger = logging.getLogger(__name__)
 
+# Words that mark a character facing a choice, questions, or conflict
+_DECISION_RE = re.compile(
+    r'\b(should|could|must|what if|either|or|choose|decide|question|dilemma|conflict)\b',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=512)
+def _parse_json_object(text: str) -> Optional[Mapping[str, Any]]:
+    """Extract the first JSON object from an LLM response, tolerating preamble.
+    
+    Results are cached by response text, since retries and regenerations often
+    return identical responses; the object is returned read-only for that reason.
+    """
+    # Non-strict so multi-line dialogue with raw newlines inside string values still parses
+    decoder = json.JSONDecoder(strict=False)
+    start = text.find("{")
+    while start != -1:
+        try:
+            data, _ = decoder.raw_decode(text, start)
+            if isinstance(data, dict):
+                return MappingProxyType(data)
+        except json.JSONDecodeError:
+            pass
+        start = text.find("{", start + 1)
+    return None
+
+
+class _LazyValue:
+    """Placeholder for a _LazyDict entry that has not been computed yet."""
+    
+    __slots__ = ("factory",)
+    
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self.factory = factory
+
+
+class _LazyDict(dict):
+    """Dict whose lazy entries are computed by a zero-argument factory on first access.
+    
+    Single-key reads ([], get, pop, popitem, setdefault) compute only that entry.
+    Whole-dict operations (iteration, keys/values/items, copy, ==, |, repr, dict(),
+    json.dumps, pickling) resolve every pending entry first, so consumers never see
+    the placeholder.
+    """
+    
+    def __init__(self, *args: Any, lazy: Optional[Dict[str, Callable[[], Any]]] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        for key, factory in (lazy or {}).items():
+            super().__setitem__(key, _LazyValue(factory))
+    
+    def __getitem__(self, key: Any) -> Any:
+        value = super().__getitem__(key)
+        if isinstance(value, _LazyValue):
+            value = value.factory()
+            super().__setitem__(key, value)
+        return value
+    
+    def _resolve_all(self) -> None:
+        for key, value in list(super().items()):
+            if isinstance(value, _LazyValue):
+                super().__setitem__(key, value.factory())
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self[key] if key in self else default
+    
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key in self:
+            self[key]
+        return super().pop(key, *default)
+    
+    def popitem(self) -> Tuple[Any, Any]:
+        key, value = super().popitem()
+        if isinstance(value, _LazyValue):
+            value = value.factory()
+        return key, value
+    
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        return self[key] if key in self else super().setdefault(key, default)
+    
+    def __iter__(self):
+        self._resolve_all()
+        return super().__iter__()
+    
+    def keys(self):
+        self._resolve_all()
+        return super().keys()
+    
+    def values(self):
+        self._resolve_all()
+        return super().values()
+    
+    def items(self):
+        self._resolve_all()
+        return super().items()
+    
+    def copy(self) -> Dict[Any, Any]:
+        self._resolve_all()
+        return dict(super().items())
+    
+    def __eq__(self, other: Any) -> bool:
+        self._resolve_all()
+        if isinstance(other, _LazyDict):
+            other._resolve_all()
+        return super().__eq__(other)
+    
+    def __ne__(self, other: Any) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+    
+    __hash__ = None  # type: ignore[assignment]
+    
+    def __or__(self, other: Any) -> Any:
+        self._resolve_all()
+        return super().__or__(other)
+    
+    def __ror__(self, other: Any) -> Any:
+        self._resolve_all()
+        return super().__ror__(other)
+    
+    def __repr__(self) -> str:
+        self._resolve_all()
+        return super().__repr__()
+
+
+# Structure-based alternatives explored by _generate_structural_branches
+_STRUCTURAL_ALTERNATIVES = {
+    "tension_escalation": "Focus on building tension and conflict",
+    "emotional_revelation": "Focus on character emotional discovery",
+    "relationship_shift": "Focus on changing character relationships",
+    "plot_advancement": "Focus on advancing the main plot"
+}
+
+# Request tail for the batched structural call; the scene prefix goes before it
+_STRUCTURAL_PROMPT_TAIL = """Generate one continuation for each structural focus:
+{focus_lines}
+
+Each continuation should be 300-400 words that:
+- Emphasizes its structural focus
+- Maintains character consistency
+- Advances the story meaningfully
+- Uses theatrical formatting (character names in CAPS, stage directions in parentheses)
+
+Return JSON only: {{{json_shape}}}
+""".format(
+    focus_lines="\n".join(
+        f"- {structure_type}: {description}"
+        for structure_type, description in _STRUCTURAL_ALTERNATIVES.items()
+    ),
+    json_shape=", ".join(f'"{structure_type}": "..."' for structure_type in _STRUCTURAL_ALTERNATIVES)
+)
+
+
+@lru_cache(maxsize=128)
+def _collapse_context_static(act_number: int, scene_number: int, max_branches: int) -> Tuple[Tuple[str, Any], ...]:
+    """Collapse-trigger context that depends only on scene position and breadth."""
+    return (
+        ("act_number", act_number),
+        ("scene_number", scene_number),
+        ("act_ending_approaches", scene_number >= 4),
+        ("climax_approaching", act_number == 3 and scene_number >= 3),
+        ("character_makes_irreversible_choice", False),  # Would need content analysis
+        ("theme_needs_resolution", act_number == 3),
+        ("max_branches", max_branches)
+    )
+
+
 class QuantumExplorationMode(str, Enum):
     """Modes of quantum narrative exploration."""
     DISABLED = "disabled"               # Standard linear generation
@@ -38,7 +212,8 @@ class QuantumExplorationMode(str, Enum):
 class QuantumPlaywright(Playwright):
     """Enhanced playwright with quantum narrative exploration capabilities."""
     
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    # Counters such as llm_call_count are bumped per LLM call; keep assignment unvalidated
+    model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=False)
     
     # Quantum narrative components
     quantum_tree: Optional[QuantumNarrativeTree] = None
@@ -61,6 +236,19 @@ class QuantumPlaywright(Playwright):
     # Performance settings
     quantum_enabled: bool = Field(default=False)
     exploration_timeout: float = Field(default=30.0)  # Seconds
+    max_concurrent_generations: int = Field(default=8, ge=1)  # Branch generation tasks in flight
+    
+    # Static prompt prefixes keyed by (branch_id, requirements key), for the current batch only
+    _branch_prefix_cache: Dict[Tuple[str, Tuple[Any, ...]], str] = PrivateAttr(default_factory=dict)
+    
+    # Branch ids awaiting expansion, in breadth-first order
+    _frontier: Deque[str] = PrivateAttr(default_factory=deque)
+    
+    # Worker threads for blocking LLM backends while an exploration is running
+    _llm_executor: Optional[ThreadPoolExecutor] = PrivateAttr(default=None)
+    
+    # Calls submitted to the exploration executor that have not finished yet
+    _llm_futures: Set[Future] = PrivateAttr(default_factory=set)
     
     def __init__(self, **data: Any) -> None:
         """Initialize quantum playwright."""
@@ -106,6 +294,22 @@ class QuantumPlaywright(Playwright):
         logger.info(f"LLM call #{self.llm_call_count} for quantum exploration")
         return self.get_llm().invoke(prompt)
     
+    async def atracked_llm_invoke(self, prompt: str):
+        """Invoke LLM asynchronously with call tracking."""
+        self.llm_call_count += 1
+        logger.info(f"LLM call #{self.llm_call_count} for quantum exploration")
+        llm = self.get_llm()
+        if hasattr(llm, "ainvoke"):
+            return await llm.ainvoke(prompt)
+        # Backends without a native async API run on worker threads; outside an
+        # exploration there is no dedicated executor and the loop default is used
+        if self._llm_executor is None:
+            return await asyncio.get_running_loop().run_in_executor(None, llm.invoke, prompt)
+        future = self._llm_executor.submit(llm.invoke, prompt)
+        self._llm_futures.add(future)
+        future.add_done_callback(self._llm_futures.discard)
+        return await asyncio.wrap_future(future)
+    
     def generate_scene_with_quantum_exploration(self,
                                                requirements: SceneRequirements,
                                                explore_alternatives: bool = True,
@@ -115,6 +319,25 @@ class QuantumPlaywright(Playwright):
         """
         Generate scene with quantum narrative exploration.
         
+        Synchronous wrapper around agenerate_scene_with_quantum_exploration.
+        """
+        return asyncio.run(self.agenerate_scene_with_quantum_exploration(
+            requirements,
+            explore_alternatives=explore_alternatives,
+            force_collapse=force_collapse,
+            exploration_focus=exploration_focus,
+            progress_callback=progress_callback
+        ))
+    
+    async def agenerate_scene_with_quantum_exploration(self,
+                                                       requirements: SceneRequirements,
+                                                       explore_alternatives: bool = True,
+                                                       force_collapse: bool = False,
+                                                       exploration_focus: Optional[str] = None,
+                                                       progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Generate scene with quantum narrative exploration.
+        
         Args:
             requirements: Scene requirements
             explore_alternatives: Whether to explore alternative narrative paths
@@ -135,6 +358,7 @@ class QuantumPlaywright(Playwright):
         try:
             # Initialize quantum tree if needed
             if not self.quantum_tree:
+                self._frontier.clear()
                 initial_state = self._create_initial_quantum_state(requirements)
                 self.quantum_tree = QuantumNarrativeTree(
                     root_state=initial_state,
@@ -149,12 +373,29 @@ class QuantumPlaywright(Playwright):
                         "message": "Initializing quantum narrative exploration"
                     })
             
-            # Generate and explore narrative branches
-            exploration_result = self._explore_narrative_branches(
-                requirements, 
-                exploration_focus, 
-                progress_callback
-            )
+            # Generate and explore narrative branches, bounded by the exploration timeout.
+            # Blocking backends run on a dedicated executor that is abandoned afterwards,
+            # since asyncio.run would otherwise wait for timed-out calls to return.
+            self._llm_executor = ThreadPoolExecutor(thread_name_prefix="quantum-llm")
+            try:
+                exploration_result = await asyncio.wait_for(
+                    self._explore_narrative_branches(
+                        requirements, 
+                        exploration_focus, 
+                        progress_callback
+                    ),
+                    timeout=self.exploration_timeout
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"Quantum exploration timed out after {self.exploration_timeout}s, proceeding with existing branches")
+                exploration_result = {"error": "exploration_timeout"}
+            finally:
+                # Drop queued calls explicitly; shutdown(cancel_futures=True) needs Python 3.9
+                for future in list(self._llm_futures):
+                    future.cancel()
+                self._llm_futures.clear()
+                self._llm_executor.shutdown(wait=False)
+                self._llm_executor = None
             
             # Determine if collapse is needed
             collapse_trigger = None
@@ -186,34 +427,38 @@ class QuantumPlaywright(Playwright):
             # Calculate exploration time
             exploration_time = time.time() - start_time
             
-            # Create comprehensive result
-            result = {
+            # Add standard scene metadata if collapsed
+            scene_metadata = {}
+            if timeline_state == "collapsed":
+                scene_metadata = {
+                    "scene_id": lambda: selected_branch.branch_id,
+                    "narrative_analysis": lambda: self._analyze_final_narrative(selected_branch),
+                    "character_development": lambda: self._extract_character_development(selected_branch),
+                    "thematic_elements": lambda: self._extract_thematic_elements(selected_branch)
+                }
+            
+            # Create comprehensive result; summaries are built on first access from a
+            # snapshot of the branches, so later exploration does not change them
+            active_branches = list(self.quantum_tree.active_branches.items())
+            result = _LazyDict({
                 "scene": final_scene,
-                "quantum_metadata": {
+                "quantum_metadata": _LazyDict({
                     "exploration_mode": self.exploration_mode,
                     "timeline_state": timeline_state,
                     "exploration_time": exploration_time,
-                    "branches_explored": len(self.quantum_tree.active_branches),
+                    "branches_explored": len(active_branches),
                     "total_llm_calls": self.llm_call_count,
                     "collapse_trigger": collapse_trigger.dict() if collapse_trigger else None,
-                    "exploration_summary": self.quantum_tree.get_exploration_summary(),
-                    "alternative_paths": self._get_alternative_paths_summary()
-                },
+                    "exploration_summary": self.quantum_tree.get_exploration_summary()
+                }, lazy={
+                    "alternative_paths": lambda: self._get_alternative_paths_summary(active_branches)
+                }),
                 "evaluation": exploration_result.get("best_branch_evaluation", {}),
                 "timing_metrics": {
                     "quantum_exploration": exploration_time,
                     "total_time": exploration_time
                 }
-            }
-            
-            # Add standard scene metadata if collapsed
-            if timeline_state == "collapsed":
-                result.update({
-                    "scene_id": selected_branch.branch_id,
-                    "narrative_analysis": self._analyze_final_narrative(selected_branch),
-                    "character_development": self._extract_character_development(selected_branch),
-                    "thematic_elements": self._extract_thematic_elements(selected_branch)
-                })
+            }, lazy=scene_metadata)
             
             return result
             
@@ -274,10 +519,10 @@ class QuantumPlaywright(Playwright):
         
         return initial_state
     
-    def _explore_narrative_branches(self,
-                                   requirements: SceneRequirements,
-                                   exploration_focus: Optional[str],
-                                   progress_callback: Optional[Callable[[Dict[str, Any]], None]]) -> Dict[str, Any]:
+    async def _explore_narrative_branches(self,
+                                         requirements: SceneRequirements,
+                                         exploration_focus: Optional[str],
+                                         progress_callback: Optional[Callable[[Dict[str, Any]], None]]) -> Dict[str, Any]:
         """Explore narrative branches based on exploration mode."""
         if not self.quantum_tree or not self.branch_generator:
             return {"error": "Quantum components not initialized"}
@@ -289,42 +534,56 @@ class QuantumPlaywright(Playwright):
             "exploration_notes": []
         }
         
-        # Get current active branches to explore from
-        branches_to_explore = list(self.quantum_tree.active_branches.values())
+        # Prefixes are only shared by the prompts of one batch, so drop the previous batch's
+        self._branch_prefix_cache.clear()
+        
+        # Seed the frontier with unexpanded leaves when starting on a tree
+        if not self._frontier:
+            self._frontier.extend(
+                branch_id for branch_id, branch in self.quantum_tree.active_branches.items()
+                if not branch.child_branches
+            )
+        
+        # Take at most one breadth's worth of frontier branches per call
+        branches_to_explore = []
+        while self._frontier and len(branches_to_explore) < self.exploration_breadth:
+            current_branch = self.quantum_tree.active_branches.get(self._frontier.popleft())
+            if current_branch is None or current_branch.depth_level >= self.max_exploration_depth:
+                continue  # Pruned since it was queued, or already at the depth limit
+            branches_to_explore.append(current_branch)
         
+        # Fan out every (branch, exploration mode) pair so LLM calls overlap
+        generation_tasks = []
         for current_branch in branches_to_explore:
-            if current_branch.depth_level >= self.max_exploration_depth:
-                continue
-            
-            # Generate branches based on exploration mode
-            new_branches = []
-            
             if self.exploration_mode in [QuantumExplorationMode.CHARACTER_FOCUSED, QuantumExplorationMode.FULL_EXPLORATION]:
-                new_branches.extend(self._generate_character_branches(current_branch, requirements, exploration_focus))
+                generation_tasks.append((current_branch, self._generate_character_branches(current_branch, requirements, exploration_focus)))
             
             if self.exploration_mode in [QuantumExplorationMode.THEMATIC_FOCUSED, QuantumExplorationMode.FULL_EXPLORATION]:
-                new_branches.extend(self._generate_thematic_branches(current_branch, requirements))
+                generation_tasks.append((current_branch, self._generate_thematic_branches(current_branch, requirements)))
             
             if self.exploration_mode in [QuantumExplorationMode.STRUCTURAL_FOCUSED, QuantumExplorationMode.FULL_EXPLORATION]:
-                new_branches.extend(self._generate_structural_branches(current_branch, requirements))
-            
+                generation_tasks.append((current_branch, self._generate_structural_branches(current_branch, requirements)))
+        
+        try:
+            generated = await self._run_generation_tasks([task for _, task in generation_tasks])
+        except asyncio.CancelledError:
+            # Requeue the batch so a later call can expand it
+            self._frontier.extendleft(reversed([branch.branch_id for branch in branches_to_explore]))
+            raise
+        
+        added_branches = []
+        for (current_branch, _), new_branches in zip(generation_tasks, generated):
             # Add viable branches to quantum tree
             for branch in new_branches:
-                if self.quantum_tree.add_branch(current_branch.branch_id, branch):
+                # Metrics are final once generated, so score each branch once
+                branch_quality = branch.calculate_overall_quality()
+                if branch_quality < self.min_branch_quality:
+                    logger.debug(f"Skipping branch {branch.branch_id} below quality threshold ({branch_quality:.3f})")
+                    continue
+                if self.quantum_tree.add_branch(current_branch.branch_id, branch, quality=branch_quality):
                     exploration_results["branches_generated"] += 1
-                    
-                    # Track best branch
-                    branch_quality = branch.calculate_overall_quality()
-                    if branch_quality > exploration_results["best_branch_quality"]:
-                        exploration_results["best_branch_quality"] = branch_quality
-                        exploration_results["best_branch_evaluation"] = {
-                            "character_consistency": branch.character_consistency,
-                            "thematic_alignment": branch.thematic_alignment,
-                            "dramatic_tension": branch.dramatic_tension,
-                            "emotional_resonance": branch.emotional_resonance,
-                            "narrative_coherence": branch.narrative_coherence,
-                            "overall_quality": branch_quality
-                        }
+                    added_branches.append((branch_quality, branch))
+                    self._frontier.append(branch.branch_id)
             
             # Update progress
             if progress_callback:
@@ -334,6 +593,20 @@ class QuantumPlaywright(Playwright):
                     "branches_active": len(self.quantum_tree.active_branches)
                 })
         
+        # Track best branch in a single pass over the scored branches
+        if added_branches:
+            best_quality, best_branch = max(added_branches, key=lambda item: item[0])
+            if best_quality > exploration_results["best_branch_quality"]:
+                exploration_results["best_branch_quality"] = best_quality
+                exploration_results["best_branch_evaluation"] = {
+                    "character_consistency": best_branch.character_consistency,
+                    "thematic_alignment": best_branch.thematic_alignment,
+                    "dramatic_tension": best_branch.dramatic_tension,
+                    "emotional_resonance": best_branch.emotional_resonance,
+                    "narrative_coherence": best_branch.narrative_coherence,
+                    "overall_quality": best_quality
+                }
+        
         exploration_results["exploration_notes"] = [
             f"Generated {exploration_results['branches_generated']} branches",
             f"Best branch quality: {exploration_results['best_branch_quality']:.3f}",
@@ -342,41 +615,74 @@ class QuantumPlaywright(Playwright):
         
         return exploration_results
     
-    def _generate_character_branches(self,
-                                    current_branch: NarrativeQuantumState,
-                                    requirements: SceneRequirements,
-                                    focus_character: Optional[str]) -> List[NarrativeQuantumState]:
+    async def _run_generation_tasks(self, tasks: List[Awaitable[Any]]) -> List[Any]:
+        """Run generation coroutines on a bounded pool of queue workers.
+        
+        Each worker pulls the next pending task as soon as its current one finishes,
+        so one long generation does not hold back the rest of the batch. Results are
+        returned in the order of the given tasks; if any task fails, the other workers
+        are cancelled and the error is raised.
+        """
+        results: List[Any] = [None] * len(tasks)
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, task in enumerate(tasks):
+            queue.put_nowait((index, task))
+        
+        async def worker() -> None:
+            while not queue.empty():
+                index, task = queue.get_nowait()
+                results[index] = await task
+        
+        workers = [
+            asyncio.ensure_future(worker())
+            for _ in range(min(len(tasks), self.max_concurrent_generations))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            # Stop sibling workers so a failed batch does not keep spending LLM calls
+            for running in workers:
+                running.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        finally:
+            # Close coroutines that never started if a worker failed or we were cancelled
+            while not queue.empty():
+                queue.get_nowait()[1].close()
+        return results
+    
+    async def _generate_character_branches(self,
+                                          current_branch: NarrativeQuantumState,
+                                          requirements: SceneRequirements,
+                                          focus_character: Optional[str]) -> List[NarrativeQuantumState]:
         """Generate branches focused on character psychology."""
         if not self.branch_generator:
             return []
         
-        branches = []
-        
         # Determine which characters to explore
         characters_to_explore = [focus_character] if focus_character else requirements.characters[:2]  # Limit to 2 for performance
+        prefixed_invoke = self._prefixed_llm_invoke(self._build_static_branch_prefix(current_branch, requirements))
         
-        for character in characters_to_explore:
-            if character not in current_branch.character_states:
-                continue
-            
-            # Create decision context
-            decision_context = self._extract_decision_context(current_branch, character, requirements)
-            
-            # Generate psychology-based branches
-            char_branches = self.branch_generator.generate_character_psychology_branches(
+        character_tasks = [
+            self.branch_generator.agenerate_character_psychology_branches(
                 character_name=character,
-                decision_context=decision_context,
+                decision_context=self._extract_decision_context(current_branch, character, requirements),
                 current_state=current_branch,
-                llm_invoke_func=self.tracked_llm_invoke
+                allm_invoke_func=prefixed_invoke
             )
-            
+            for character in characters_to_explore
+            if character in current_branch.character_states
+        ]
+        
+        branches = []
+        for char_branches in await asyncio.gather(*character_tasks):
             branches.extend(char_branches)
         
         return branches
     
-    def _generate_thematic_branches(self,
-                                   current_branch: NarrativeQuantumState,
-                                   requirements: SceneRequirements) -> List[NarrativeQuantumState]:
+    async def _generate_thematic_branches(self,
+                                         current_branch: NarrativeQuantumState,
+                                         requirements: SceneRequirements) -> List[NarrativeQuantumState]:
         """Generate branches focused on thematic exploration."""
         if not self.branch_generator:
             return []
@@ -388,73 +694,100 @@ class QuantumPlaywright(Playwright):
             "individual desires vs collective needs"  # Default tension
         )
         
-        return self.branch_generator.generate_thematic_exploration_branches(
+        return await self.branch_generator.agenerate_thematic_exploration_branches(
             thematic_tension=thematic_tension,
             current_state=current_branch,
-            llm_invoke_func=self.tracked_llm_invoke
+            allm_invoke_func=self._prefixed_llm_invoke(self._build_static_branch_prefix(current_branch, requirements)),
+            include_scene_context=False
         )
     
-    def _generate_structural_branches(self,
-                                     current_branch: NarrativeQuantumState,
-                                     requirements: SceneRequirements) -> List[NarrativeQuantumState]:
+    async def _generate_structural_branches(self,
+                                           current_branch: NarrativeQuantumState,
+                                           requirements: SceneRequirements) -> List[NarrativeQuantumState]:
         """Generate branches focused on dramatic structure alternatives."""
         # This is a simplified implementation - could be expanded significantly
         branches = []
         
-        # Determine structural context
-        act_number = requirements.act_number
-        scene_number = requirements.scene_number
+        # One batched call for all alternatives shares the scene context prefill
+        prompt = self._build_static_branch_prefix(current_branch, requirements) + _STRUCTURAL_PROMPT_TAIL
         
-        # Generate structure-based alternatives
-        structural_alternatives = {
-            "tension_escalation": "Focus on building tension and conflict",
-            "emotional_revelation": "Focus on character emotional discovery",
-            "relationship_shift": "Focus on changing character relationships",
-            "plot_advancement": "Focus on advancing the main plot"
-        }
+        try:
+            response = await self.atracked_llm_invoke(prompt)
+        except Exception as e:
+            logger.error(f"Error generating structural branches: {str(e)}")
+            return branches
+        
+        response_text = str(response.content if hasattr(response, "content") else response)
+        continuations = _parse_json_object(response_text)
+        if continuations is None:
+            logger.error("Structural branch response did not contain a JSON object")
+            return branches
+        
+        for structure_type, description in _STRUCTURAL_ALTERNATIVES.items():
+            continuation = continuations.get(structure_type)
+            if not continuation:
+                logger.warning(f"No continuation returned for structural branch {structure_type}")
+                continue
+            
+            # Create structural branch
+            structural_branch = NarrativeQuantumState(
+                narrative_content=str(continuation),
+                divergence_point=f"Structural focus: {structure_type}",
+                divergence_type=DivergenceType.DRAMATIC_STRUCTURE,
+                divergence_description=description,
+                parent_branch=current_branch.branch_id,
+                depth_level=current_branch.depth_level + 1
+            )
+            
+            # Overlay the structural focus on the parent world state without copying it
+            structural_branch.world_state = ChainMap({"structural_focus": structure_type}, current_branch.world_state)
+            
+            # Set quality metrics
+            structural_branch.dramatic_tension = 0.7 if "tension" in structure_type else 0.5
+            structural_branch.emotional_resonance = 0.7 if "emotional" in structure_type else 0.5
+            structural_branch.narrative_coherence = 0.6  # Structural branches generally coherent
+            
+            branches.append(structural_branch)
         
-        for structure_type, description in structural_alternatives.items():
-            prompt = f"""Based on this current scene context:
-{current_branch.narrative_content[:300]}...
+        return branches
+    
+    def _build_static_branch_prefix(self,
+                                    current_branch: NarrativeQuantumState,
+                                    requirements: SceneRequirements) -> str:
+        """
+        Build the shared prompt prefix for every expansion of a branch.
+        
+        The prefix is byte-identical across the character, thematic and structural
+        prompts of a branch so provider-side prompt caching can reuse its prefill;
+        only the dynamic instructions that follow it vary. It is the only copy of the
+        scene excerpt and world state in those prompts.
+        """
+        requirements_key = (
+            requirements.act_number,
+            requirements.scene_number,
+            requirements.setting,
+            tuple(requirements.characters)
+        )
+        cache_key = (current_branch.branch_id, requirements_key)
+        prefix = self._branch_prefix_cache.get(cache_key)
+        if prefix is None:
+            prefix = f"""SCENE CONTEXT: Act {requirements.act_number}, Scene {requirements.scene_number}
+Setting: {requirements.setting}
+Characters: {', '.join(requirements.characters)}
+World state: {json.dumps(dict(current_branch.world_state), sort_keys=True, default=str)}
 
-Generate a continuation that emphasizes {description}. This is Act {act_number}, Scene {scene_number}.
+Current scene excerpt:
+{current_branch.narrative_content[:500]}...
 
-Create 300-400 words that:
-- {description}
-- Maintains character consistency
-- Advances the story meaningfully
-- Uses theatrical formatting (character names in CAPS, stage directions in parentheses)
 """
-            
-            try:
-                response = self.tracked_llm_invoke(prompt)
-                response_text = str(response.content if hasattr(response, "content") else response)
-                
-                # Create structural branch
-                structural_branch = NarrativeQuantumState(
-                    narrative_content=response_text,
-                    divergence_point=f"Structural focus: {structure_type}",
-                    divergence_type=DivergenceType.DRAMATIC_STRUCTURE,
-                    divergence_description=description,
-                    parent_branch=current_branch.branch_id,
-                    depth_level=current_branch.depth_level + 1
-                )
-                
-                # Copy and update world state
-                structural_branch.world_state = current_branch.world_state.copy()
-                structural_branch.world_state["structural_focus"] = structure_type
-                
-                # Set quality metrics
-                structural_branch.dramatic_tension = 0.7 if "tension" in structure_type else 0.5
-                structural_branch.emotional_resonance = 0.7 if "emotional" in structure_type else 0.5
-                structural_branch.narrative_coherence = 0.6  # Structural branches generally coherent
-                
-                branches.append(structural_branch)
-                
-            except Exception as e:
-                logger.error(f"Error generating structural branch {structure_type}: {str(e)}")
-        
-        return branches
+            self._branch_prefix_cache[cache_key] = prefix
+        return prefix
+    
+    def _prefixed_llm_invoke(self, prefix: str) -> Callable:
+        """Wrap atracked_llm_invoke so every prompt starts with the given prefix."""
+        async def invoke(prompt: str):
+            return await self.atracked_llm_invoke(prefix + prompt)
+        return invoke
     
     def _extract_decision_context(self,
                                  current_branch: NarrativeQuantumState,
@@ -465,20 +798,21 @@ Create 300-400 words that:
         content = current_branch.narrative_content
         
         # Simple heuristic: look for questions, conflicts, or choices
-        decision_indicators = [
-            "should", "could", "must", "what if", "either", "or",
-            "choose", "decide", "question", "dilemma", "conflict"
-        ]
-        
-        # Extract relevant context
-        sentences = content.split('.')
-        decision_sentences = [
-            sentence.strip() for sentence in sentences
-            if any(indicator in sentence.lower() for indicator in decision_indicators)
-        ]
+        decision_sentences = []
+        sentence_end = -1
+        for match in _DECISION_RE.finditer(content):
+            if match.start() < sentence_end:
+                continue  # Another indicator in a sentence already collected
+            sentence_start = content.rfind('.', 0, match.start()) + 1
+            sentence_end = content.find('.', match.end())
+            if sentence_end == -1:
+                sentence_end = len(content)
+            decision_sentences.append(content[sentence_start:sentence_end].strip())
+            if len(decision_sentences) == 2:  # First 2 relevant sentences
+                break
         
         if decision_sentences:
-            decision_context = ". ".join(decision_sentences[:2])  # First 2 relevant sentences
+            decision_context = ". ".join(decision_sentences)
         else:
             # Fallback: use scene outline or general context
             decision_context = (
@@ -490,16 +824,11 @@ Create 300-400 words that:
     
     def _build_collapse_context(self, requirements: SceneRequirements) -> Dict[str, Any]:
         """Build context for evaluating collapse triggers."""
-        return {
-            "act_number": requirements.act_number,
-            "scene_number": requirements.scene_number,
-            "act_ending_approaches": requirements.scene_number >= 4,
-            "climax_approaching": requirements.act_number == 3 and requirements.scene_number >= 3,
-            "character_makes_irreversible_choice": False,  # Would need content analysis
-            "theme_needs_resolution": requirements.act_number == 3,
-            "branch_count": len(self.quantum_tree.active_branches) if self.quantum_tree else 0,
-            "max_branches": self.exploration_breadth
-        }
+        context = dict(_collapse_context_static(
+            requirements.act_number, requirements.scene_number, self.exploration_breadth
+        ))
+        context["branch_count"] = len(self.quantum_tree.active_branches) if self.quantum_tree else 0
+        return context
     
     def _process_collapsed_scene(self,
                                 selected_branch: NarrativeQuantumState,
@@ -531,15 +860,14 @@ Create 300-400 words that:
             "Branch Possibilities:"
         ]
         
-        # Sort branches by quality
-        sorted_branches = sorted(
-            self.quantum_tree.active_branches.values(),
-            key=lambda b: b.calculate_overall_quality(),
-            reverse=True
-        )
+        # Score each branch once and keep only the top 5 by quality
+        scored_branches = [
+            (branch.calculate_overall_quality(), branch)
+            for branch in self.quantum_tree.active_branches.values()
+        ]
+        top_branches = heapq.nlargest(5, scored_branches, key=lambda item: item[0])
         
-        for i, branch in enumerate(sorted_branches[:5]):  # Top 5 branches
-            quality = branch.calculate_overall_quality()
+        for i, (quality, branch) in enumerate(top_branches):
             summary_lines.append(
                 f"{i+1}. {branch.divergence_point} (Quality: {quality:.2f})"
             )
@@ -555,19 +883,26 @@ Create 300-400 words that:
         
         return "\n".join(summary_lines)
     
-    def _get_alternative_paths_summary(self) -> List[Dict[str, Any]]:
-        """Get summary of alternative narrative paths."""
-        if not self.quantum_tree:
-            return []
+    def _get_alternative_paths_summary(self,
+                                       branches: Optional[List[Tuple[str, NarrativeQuantumState]]] = None) -> List[Dict[str, Any]]:
+        """Get summary of alternative narrative paths.
+        
+        Args:
+            branches: (branch_id, branch) pairs to summarize; defaults to the tree's active branches
+        """
+        if branches is None:
+            if not self.quantum_tree:
+                return []
+            branches = self.quantum_tree.active_branches.items()
         
         alternatives = []
-        for branch_id, branch in self.quantum_tree.active_branches.items():
+        for branch_id, branch in branches:
             alternatives.append({
                 "branch_id": branch_id,
                 "divergence_point": branch.divergence_point,
                 "divergence_type": branch.divergence_type,
                 "quality_score": branch.calculate_overall_quality(),
-                "content_preview": branch.narrative_content[:150] + "..." if len(branch.narrative_content) > 150 else branch.narrative_content,
+                "content_preview": branch.get_content_preview(150),
                 "depth_level": branch.depth_level,
                 "exploration_notes": branch.exploration_notes[-1] if branch.exploration_notes else ""
             })
@@ -12,6 +12,7 @@ from thespian.llm.theatrical_memory import TheatricalMemory
 import logging
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 # Configure logging
@@ -1147,6 +1148,7 @@ class AdvisorManager(BaseModel):
     llm_manager: LLMManager
     memory: TheatricalMemory
     advisors: Dict[str, TheatricalAdvisor] = Field(default_factory=dict)
+    max_concurrent_advisors: int = Field(default=10, ge=1)
     
     def __init__(self, llm_manager: LLMManager, memory: TheatricalMemory, **data):
         """Initialize the advisor manager."""
@@ -1251,11 +1253,17 @@ class AdvisorManager(BaseModel):
         else:
             advisors = list(self.advisors.values())
         
-        # Run analysis with each advisor
-        for advisor in advisors:
+        if not advisors:
+            return results
+        
+        # Advisors are independent LLM calls, so run them concurrently
+        with ThreadPoolExecutor(max_workers=min(len(advisors), self.max_concurrent_advisors)) as executor:
+            futures = [executor.submit(advisor.analyze, content, context) for advisor in advisors]
+        
+        # Collect results in advisor order
+        for advisor, future in zip(advisors, futures):
             try:
-                feedback = advisor.analyze(content, context)
-                results[advisor.name] = feedback
+                results[advisor.name] = future.result()
             except Exception as e:
                 logger.error(f"Error running analysis with {advisor.name}: {str(e)}")
                 # Create a fallback feedback object for the failed advisor
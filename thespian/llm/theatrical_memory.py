@@ -301,6 +301,9 @@ class TheatricalMemory(BaseModel):
         """Update a character's profile in the memory system."""
         if not char_id or not profile:
             raise ValueError("Character ID and profile are required")
+        # Playwrights sharing this memory each push the same profiles; skip unchanged writes
+        if self.character_profiles.get(char_id) == profile:
+            return
         self.character_profiles[char_id] = profile
         self.last_modified = datetime.now()
         logger.info(f"Updated character profile for {char_id}")
@@ -2,6 +2,7 @@
 Core Theatre class that orchestrates the entire production process.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 from pydantic import BaseModel, Field
 
@@ -61,11 +62,14 @@ class Theatre(BaseModel):
         feedback = self.director.review_script(script)
         revised_script = self.playwright.revise_script(script, feedback)
 
-        # Designer creates visual elements
-        design = self.designer.create_design(revised_script)
+        # Design and character extraction both read only the revised script, so run them together
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            design_future = executor.submit(self.designer.create_design, revised_script)
+            characters_future = executor.submit(self.playwright.get_characters, revised_script)
+        design = design_future.result()
+        characters = characters_future.result()
 
         # Initialize character actors
-        characters = self.playwright.get_characters(revised_script)
         for char_name, char_data in characters.items():
             self.character_actors[char_name] = CharacterActorAgent(
                 character_name=char_name, character_data=char_data